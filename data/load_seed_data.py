@@ -4,40 +4,50 @@ Script to load seed lesson data into the database.
 This script validates the JSON data and loads it into the lesson database.
 """
 
-import json
 import sys
 import os
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 
-# Add src to path to import models
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+# Add the project root to path to import the src package
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from models.lesson import Lesson
-from models.database import DatabaseManager
+from src.models.lesson import Lesson
+from src.models.database import DatabaseManager
+from src.utils.json_utils import loads
+
+
+@lru_cache(maxsize=4)
+def _load_raw(json_file_path: str) -> bytes:
+    """Read the raw seed file once and reuse the bytes on subsequent calls."""
+    return Path(json_file_path).read_bytes()
 
 
 def load_seed_lessons(json_file_path: str = "data/seed_lessons.json") -> list[Lesson]:
     """Load and validate lesson data from JSON file."""
     
     try:
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = loads(_load_raw(json_file_path))
     except FileNotFoundError:
         raise FileNotFoundError(f"Seed data file not found: {json_file_path}")
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         raise ValueError(f"Invalid JSON in seed data file: {e}")
     
     if 'lessons' not in data:
         raise ValueError("Seed data must contain 'lessons' key")
     
-    lessons = []
-    for i, lesson_data in enumerate(data['lessons']):
-        try:
-            lesson = Lesson.from_dict(lesson_data)
-            lesson.validate()  # Validate the lesson data
-            lessons.append(lesson)
-        except Exception as e:
-            raise ValueError(f"Invalid lesson data at index {i}: {e}")
+    lessons = [Lesson.from_dict(lesson_data) for lesson_data in data['lessons']]
+    
+    # Validate in a single pass and report every bad lesson at once
+    errors = [
+        (i, error)
+        for i, lesson in enumerate(lessons)
+        for error in lesson.validate_errors()
+    ]
+    if errors:
+        details = "; ".join(f"index {i}: {error}" for i, error in errors)
+        raise ValueError(f"Invalid lesson data at {details}")
     
     return lessons
 
@@ -51,20 +61,16 @@ def main():
         print(f"✅ Successfully loaded {len(lessons)} lessons")
         
         # Count by category
-        categories = {}
-        difficulties = {}
-        
-        for lesson in lessons:
-            categories[lesson.category] = categories.get(lesson.category, 0) + 1
-            difficulties[lesson.difficulty] = difficulties.get(lesson.difficulty, 0) + 1
+        categories = Counter(lesson.category for lesson in lessons)
+        difficulties = Counter(lesson.difficulty for lesson in lessons)
         
         print("\n📊 Category Distribution:")
-        for category, count in categories.items():
+        for category, count in categories.most_common():
             percentage = (count / len(lessons)) * 100
             print(f"  {category}: {count} lessons ({percentage:.1f}%)")
         
         print("\n📈 Difficulty Distribution:")
-        for difficulty, count in difficulties.items():
+        for difficulty, count in difficulties.most_common():
             percentage = (count / len(lessons)) * 100
             print(f"  {difficulty}: {count} lessons ({percentage:.1f}%)")
         
@@ -72,14 +78,14 @@ def main():
         if len(lessons) < 50:
             print(f"⚠️  Warning: Only {len(lessons)} lessons (minimum 50 recommended)")
         
-        if categories.get('grammar', 0) < 20:
-            print(f"⚠️  Warning: Only {categories.get('grammar', 0)} grammar lessons (20+ recommended)")
+        if categories['grammar'] < 20:
+            print(f"⚠️  Warning: Only {categories['grammar']} grammar lessons (20+ recommended)")
         
-        if categories.get('vocabulary', 0) < 18:
-            print(f"⚠️  Warning: Only {categories.get('vocabulary', 0)} vocabulary lessons (18+ recommended)")
+        if categories['vocabulary'] < 18:
+            print(f"⚠️  Warning: Only {categories['vocabulary']} vocabulary lessons (18+ recommended)")
         
-        if categories.get('common_mistakes', 0) < 13:
-            print(f"⚠️  Warning: Only {categories.get('common_mistakes', 0)} common mistake lessons (13+ recommended)")
+        if categories['common_mistakes'] < 13:
+            print(f"⚠️  Warning: Only {categories['common_mistakes']} common mistake lessons (13+ recommended)")
         
         print("\n✅ Seed data validation complete!")
         
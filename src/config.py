@@ -1,74 +1,159 @@
 """Configuration management using environment variables."""
 
 import os
-from typing import Optional
-from dotenv import load_dotenv
+import re
+from dataclasses import dataclass, field
+from datetime import time
+from functools import cache
+from pathlib import Path
+from typing import Dict, FrozenSet, Mapping, Optional
+from dotenv import dotenv_values
 
-# Load environment variables from .env file if it exists
-load_dotenv()
+# Posting time as H:MM or HH:MM on a 24-hour clock
+_POSTING_TIME_RE = re.compile(r'^([01]?\d|2[0-3]):([0-5]\d)$')
 
+# Channel username (@name, 5+ characters) or numeric chat ID (-100...)
+_CHANNEL_ID_RE = re.compile(r'^(@[A-Za-z0-9_]{5,}|-\d+)$')
 
+# One comma-separated ADMIN_USER_IDS entry: an integer with optional surrounding spaces
+_ADMIN_ID_RE = re.compile(r'\s*(-?\d+)\s*')
+
+# Project .env file; passing the path directly skips python-dotenv's directory search
+_ENV_FILE = Path(__file__).resolve().parent.parent / ".env"
+
+
+@cache
+def _load_dotenv_once() -> Dict[str, str]:
+    """Parse the project's .env file once and return its values."""
+    return {key: value for key, value in dotenv_values(_ENV_FILE).items() if value is not None}
+
+
+# Load environment variables from .env without overriding ones already set
+for _key, _value in _load_dotenv_once().items():
+    os.environ.setdefault(_key, _value)
+
+
+def parse_posting_time(value: str) -> time:
+    """Parse an HH:MM posting time, raising ValueError if it is malformed."""
+    match = _POSTING_TIME_RE.match(value or "")
+    if not match:
+        raise ValueError("Invalid posting time format (use HH:MM)")
+    return time(int(match[1]), int(match[2]))
+
+
+def parse_admin_user_ids(value: str) -> FrozenSet[int]:
+    """Parse comma-separated admin user IDs, raising ValueError on a malformed entry.
+    
+    Blank entries (e.g. from a trailing comma) are ignored.
+    """
+    admin_ids = set()
+    for token in (value or "").split(","):
+        if not token.strip():
+            continue
+        match = _ADMIN_ID_RE.fullmatch(token)
+        if not match:
+            raise ValueError(f"Invalid admin user ID in ADMIN_USER_IDS: {token.strip()!r}")
+        admin_ids.add(int(match[1]))
+    return frozenset(admin_ids)
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Configuration class that loads settings from environment variables."""
+    """Immutable configuration loaded from environment variables.
     
-    def __init__(self):
-        """Initialize configuration from environment variables."""
-        self.bot_token = self._get_required_env("BOT_TOKEN")
-        self.channel_id = self._get_required_env("CHANNEL_ID")
-        self.posting_time = os.getenv("POSTING_TIME", "09:00")
-        self.timezone = os.getenv("TIMEZONE", "UTC")
-        self.retry_attempts = int(os.getenv("RETRY_ATTEMPTS") or "3")
-        self.retry_delay = int(os.getenv("RETRY_DELAY") or "60")
-        self.database_path = os.getenv("DATABASE_PATH", "lessons.db")
-        self.database_type = os.getenv("DATABASE_TYPE", "sqlite")  # sqlite or supabase
-        
-        # Admin Configuration
-        admin_ids_str = os.getenv("ADMIN_USER_IDS", "")
-        self.admin_user_ids = [int(id.strip()) for id in admin_ids_str.split(",") if id.strip().isdigit()]
-        
-        # Supabase Configuration (if using Supabase)
-        self.supabase_url = os.getenv("SUPABASE_URL")
-        self.supabase_anon_key = os.getenv("SUPABASE_ANON_KEY")
-        
-        # Quiz Configuration
-        self.enable_quizzes = os.getenv("ENABLE_QUIZZES", "true").lower() == "true"
-        self.quiz_delay_minutes = int(os.getenv("QUIZ_DELAY_MINUTES") or "5")
-        self.log_level = os.getenv("LOG_LEVEL", "INFO")
-        
-        # Resource monitoring and resilience settings
-        self.max_cpu_percent = float(os.getenv("MAX_CPU_PERCENT") or "85.0")
-        self.max_memory_percent = float(os.getenv("MAX_MEMORY_PERCENT") or "85.0")
-        self.max_disk_percent = float(os.getenv("MAX_DISK_PERCENT") or "90.0")
-        self.circuit_breaker_threshold = int(os.getenv("CIRCUIT_BREAKER_THRESHOLD") or "5")
-        self.circuit_breaker_timeout = int(os.getenv("CIRCUIT_BREAKER_TIMEOUT") or "300")
-        self.enable_graceful_degradation = os.getenv("ENABLE_GRACEFUL_DEGRADATION", "true").lower() == "true"
+    Build instances with Config.from_env(); settings are validated on construction.
+    """
+    
+    bot_token: str
+    channel_id: str
+    posting_time: str = "09:00"
+    timezone: str = "UTC"
+    retry_attempts: int = 3
+    retry_delay: int = 60
+    database_path: str = "lessons.db"
+    database_type: str = "sqlite"  # sqlite or supabase
+    
+    # Admin Configuration
+    admin_user_ids: FrozenSet[int] = frozenset()
+    
+    # Supabase Configuration (if using Supabase)
+    supabase_url: Optional[str] = None
+    supabase_anon_key: Optional[str] = None
+    
+    # Quiz Configuration
+    enable_quizzes: bool = True
+    quiz_delay_minutes: int = 5
+    log_level: str = "INFO"
+    
+    # Resource monitoring and resilience settings
+    max_cpu_percent: float = 85.0
+    max_memory_percent: float = 85.0
+    max_disk_percent: float = 90.0
+    circuit_breaker_threshold: int = 5
+    circuit_breaker_timeout: int = 300
+    enable_graceful_degradation: bool = True
+    
+    # Parsed posting_time, filled in by validate()
+    posting_clock: time = field(default=time(9, 0), init=False, repr=False, compare=False)
+    
+    _validated: bool = field(default=False, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Reject invalid settings so a bad configuration can never be constructed."""
+        self.validate()
+    
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Create configuration from a single snapshot of the environment."""
+        env = os.environ.copy()
         
-    def _get_required_env(self, key: str) -> str:
+        return cls(
+            bot_token=cls._get_required_env(env, "BOT_TOKEN"),
+            channel_id=cls._get_required_env(env, "CHANNEL_ID"),
+            posting_time=env.get("POSTING_TIME", "09:00"),
+            timezone=env.get("TIMEZONE", "UTC"),
+            retry_attempts=int(env.get("RETRY_ATTEMPTS") or "3"),
+            retry_delay=int(env.get("RETRY_DELAY") or "60"),
+            database_path=env.get("DATABASE_PATH", "lessons.db"),
+            database_type=env.get("DATABASE_TYPE", "sqlite"),
+            admin_user_ids=parse_admin_user_ids(env.get("ADMIN_USER_IDS", "")),
+            supabase_url=env.get("SUPABASE_URL"),
+            supabase_anon_key=env.get("SUPABASE_ANON_KEY"),
+            enable_quizzes=env.get("ENABLE_QUIZZES", "true").lower() == "true",
+            quiz_delay_minutes=int(env.get("QUIZ_DELAY_MINUTES") or "5"),
+            log_level=env.get("LOG_LEVEL", "INFO"),
+            max_cpu_percent=float(env.get("MAX_CPU_PERCENT") or "85.0"),
+            max_memory_percent=float(env.get("MAX_MEMORY_PERCENT") or "85.0"),
+            max_disk_percent=float(env.get("MAX_DISK_PERCENT") or "90.0"),
+            circuit_breaker_threshold=int(env.get("CIRCUIT_BREAKER_THRESHOLD") or "5"),
+            circuit_breaker_timeout=int(env.get("CIRCUIT_BREAKER_TIMEOUT") or "300"),
+            enable_graceful_degradation=env.get("ENABLE_GRACEFUL_DEGRADATION", "true").lower() == "true",
+        )
+    
+    @staticmethod
+    def _get_required_env(env: Mapping[str, str], key: str) -> str:
         """Get required environment variable or raise error if missing."""
-        value = os.getenv(key)
+        value = env.get(key)
         if not value:
             raise ValueError(f"Required environment variable {key} is not set")
         return value
     
     def validate(self) -> bool:
         """Validate configuration settings."""
+        if self._validated:
+            return True
+        
         try:
             # Validate bot token format (should start with number followed by colon)
             if not self.bot_token or ":" not in self.bot_token:
                 raise ValueError("Invalid bot token format")
             
-            # Validate channel ID format (should start with @ or -)
-            if not self.channel_id or not (self.channel_id.startswith("@") or self.channel_id.startswith("-")):
+            # Validate channel ID format (@username or numeric chat ID)
+            if not _CHANNEL_ID_RE.match(self.channel_id or ""):
                 raise ValueError("Invalid channel ID format")
             
-            # Validate posting time format (HH:MM)
-            time_parts = self.posting_time.split(":")
-            if len(time_parts) != 2 or not all(part.isdigit() for part in time_parts):
-                raise ValueError("Invalid posting time format (use HH:MM)")
-            
-            hour, minute = int(time_parts[0]), int(time_parts[1])
-            if not (0 <= hour <= 23) or not (0 <= minute <= 59):
-                raise ValueError("Invalid posting time values")
+            # Validate posting time format (HH:MM) and keep the parsed value
+            object.__setattr__(self, "posting_clock", parse_posting_time(self.posting_time))
             
             # Validate retry settings
             if self.retry_attempts < 0 or self.retry_delay < 0:
@@ -90,21 +175,34 @@ class Config:
             if self.circuit_breaker_timeout < 0:
                 raise ValueError("Circuit breaker timeout must be non-negative")
             
+            object.__setattr__(self, "_validated", True)
             return True
             
         except ValueError as e:
             raise ValueError(f"Configuration validation failed: {e}")
 
 
-# Global configuration instance (lazy-loaded)
-_config = None
+# Global configuration instance, built on first use and replaced by set_config()
+_config: Optional[Config] = None
+
 
 def get_config() -> Config:
     """Get the global configuration instance."""
     global _config
     if _config is None:
-        _config = Config()
+        _config = Config.from_env()
     return _config
 
+
+def set_config(new_config: Config) -> None:
+    """Publish a replacement configuration to every later get_config() caller.
+    
+    Config is immutable, so runtime changes (e.g. a rescheduled posting time)
+    are made with dataclasses.replace() and published here. Services should
+    call get_config() when they need a setting rather than keep their own copy.
+    """
+    global _config
+    _config = new_config
+
 # For backward compatibility
 config = get_config
\ No newline at end of file
@@ -3,40 +3,57 @@
 
 import sys
 import os
-import json
 from datetime import datetime
+from pathlib import Path
+from itertools import islice
 
-# Import models and services
-from .models.lesson import Lesson
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Import services
 from .services.lesson_repository import LessonRepository
+from .utils.json_utils import loads
+
+# Lessons passed to bulk_insert_raw per call; the whole load is one transaction
+BATCH_SIZE = 1000
+
+
+def _iter_lesson_data(json_path: str):
+    """Yield lesson dicts from the seed file one at a time.
+    
+    Uses ijson to stream the 'lessons' array when it is installed, so memory
+    stays proportional to a single lesson; otherwise parses the whole file.
+    """
+    if ijson is not None:
+        with open(json_path, 'rb') as f:
+            yield from ijson.items(f, 'lessons.item')
+    else:
+        yield from loads(Path(json_path).read_bytes())['lessons']
 
 
 def load_lessons():
     """Load lessons from JSON into database."""
     
-    # Load JSON data
     json_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'seed_lessons.json')
     
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    lessons = []
-    for lesson_data in data['lessons']:
-        lesson = Lesson.from_dict(lesson_data)
-        lessons.append(lesson)
-    
-    # Save to database
+    # Stream lesson dicts from JSON into the database in batches, all in one
+    # transaction; rows go straight to SQL parameters without Lesson objects
     repo = LessonRepository()
-    for lesson in lessons:
-        repo.create_lesson(lesson)
+    loaded_count = 0
+    lesson_rows = _iter_lesson_data(json_path)
+    with repo.bulk_load_context() as conn:
+        while batch := list(islice(lesson_rows, BATCH_SIZE)):
+            loaded_count += repo.bulk_insert_raw(batch, conn=conn)
     
-    print(f"✅ Loaded {len(lessons)} lessons into database")
+    print(f"✅ Loaded {loaded_count} lessons into database")
     
     # Verify
     all_lessons = repo.get_all_lessons()
     print(f"✅ Database now contains {len(all_lessons)} lessons")
     
-    return len(lessons)
+    return loaded_count
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ Simple main.py that directly starts the scheduler without complex system integra
 
 import asyncio
 import logging
+import logging.handlers
 import sys
 import os
 import signal
@@ -12,15 +13,31 @@ import signal
 # Add parent directory to path so we can import from src
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Global shutdown event
-shutdown_event = asyncio.Event()
+from src.config import get_config
+from src.services.health_service import start_health_service, stop_health_service
+from src.services.lesson_manager import LessonManager
+from src.services.bot_controller import create_bot_controller
+from src.services.scheduler import create_scheduler_service
+
+# Interactive commands are optional; the bot still posts lessons without them
+try:
+    from src.services.command_handler import CommandHandler
+except ImportError:
+    CommandHandler = None
 
 def setup_logging():
     """Set up logging configuration."""
-    # Configure file handler with UTF-8 encoding
-    file_handler = logging.FileHandler('bot.log', encoding='utf-8')
+    # Configure rotating file handler with UTF-8 encoding (10 MB x 5 files)
+    file_handler = logging.handlers.RotatingFileHandler(
+        'bot.log', maxBytes=10 * 1024 * 1024, backupCount=5, encoding='utf-8'
+    )
     file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
     
+    # Buffer file writes; flush every 200 records, on WARNING and above, and at exit
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=200, flushLevel=logging.WARNING, target=file_handler
+    )
+    
     # Configure console handler with UTF-8 encoding and error handling
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
@@ -35,18 +52,35 @@ def setup_logging():
     
     logging.basicConfig(
         level=logging.INFO,
-        handlers=[console_handler, file_handler]
+        handlers=[console_handler, buffered_file_handler]
     )
 
-def signal_handler(signum, frame):
-    """Handle shutdown signals gracefully."""
-    logger = logging.getLogger(__name__)
-    logger.info(f"Received signal {signum}, initiating graceful shutdown...")
-    shutdown_event.set()
+def install_signal_handlers(shutdown_event: asyncio.Event):
+    """Set shutdown_event from the running loop on SIGINT/SIGTERM."""
+    loop = asyncio.get_running_loop()
+    
+    def request_shutdown(signum):
+        logger = logging.getLogger(__name__)
+        logger.info(f"Received signal {signum}, initiating graceful shutdown...")
+        
+        # Write out buffered log records in case shutdown does not complete
+        for handler in logging.getLogger().handlers:
+            handler.flush()
+        
+        shutdown_event.set()
+    
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, request_shutdown, sig)
+        except NotImplementedError:
+            # Windows event loops have no add_signal_handler; hop onto the loop instead
+            signal.signal(sig, lambda signum, frame: loop.call_soon_threadsafe(request_shutdown, signum))
 
 async def main_async():
     """Simple main async function."""
     logger = logging.getLogger(__name__)
+    shutdown_event = asyncio.Event()
+    install_signal_handlers(shutdown_event)
     
     try:
         # Setup logging
@@ -55,25 +89,30 @@ async def main_async():
         logger.info("Starting Telegram English Bot (Simple Version)")
         
         # Validate configuration
-        from src.config import get_config
         config = get_config()
         config.validate()
         logger.info(f"Configuration validated - Database: {config.database_type}")
         
         # Start health service
-        from src.services.health_service import start_health_service, stop_health_service
         start_health_service(port=8000)
         logger.info("Health service started on port 8000")
         
-        # Initialize lesson manager (uses database factory internally)
-        from src.services.lesson_manager import LessonManager
-        
-        lesson_manager = LessonManager()
+        # Initialize lesson manager (uses database factory internally) and create
+        # the bot controller concurrently; neither depends on the other. Both are
+        # awaited to completion so a created controller is always bound and gets
+        # closed by the shutdown code below, even if the lesson manager failed.
+        lesson_manager, bot_controller = await asyncio.gather(
+            asyncio.to_thread(LessonManager),
+            create_bot_controller(),
+            return_exceptions=True
+        )
+        if isinstance(bot_controller, BaseException):
+            startup_error, bot_controller = bot_controller, None
+            raise startup_error
+        if isinstance(lesson_manager, BaseException):
+            raise lesson_manager
         logger.info("Lesson manager initialized")
         
-        # Create bot controller
-        from src.services.bot_controller import create_bot_controller
-        bot_controller = await create_bot_controller()
         if not bot_controller:
             logger.error("Failed to create bot controller")
             return 1
@@ -89,7 +128,6 @@ async def main_async():
             # Continue execution - basic functionality should work without interactive features
         
         # Create and start scheduler
-        from src.services.scheduler import create_scheduler_service
         scheduler_service = await create_scheduler_service(lesson_manager, bot_controller)
         if not scheduler_service:
             logger.error("Failed to create scheduler service")
@@ -98,7 +136,8 @@ async def main_async():
         
         # Create and register command handler for interactive features
         try:
-            from src.services.command_handler import CommandHandler
+            if CommandHandler is None:
+                raise ImportError("command handler module could not be imported")
             command_handler = CommandHandler(lesson_manager, scheduler_service)
             bot_controller.register_command_handlers(command_handler)
             logger.info("Interactive command handlers registered")
@@ -129,9 +168,7 @@ async def main_async():
         return 0
         
     except Exception as e:
-        logger.error(f"Failed to start bot: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Failed to start bot: {e}")
         return 1
     
     finally:
@@ -150,6 +187,10 @@ async def main_async():
                 await bot_controller.close()
                 logger.info("Bot controller closed")
             
+            if 'command_handler' in locals() and command_handler.user_repo:
+                command_handler.user_repo.close()
+                logger.info("Queued command usage flushed")
+            
             stop_health_service()
             logger.info("Health service stopped")
             
@@ -159,10 +200,6 @@ async def main_async():
 def main():
     """Main entry point."""
     try:
-        # Set up signal handlers
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
-        
         # Run the async main function
         exit_code = asyncio.run(main_async())
         sys.exit(exit_code)
@@ -1,16 +1,41 @@
-"""Data models package for the Telegram English Bot."""
+"""Data models package for the Telegram English Bot.
 
-from .lesson import Lesson
-from .posting_history import PostingHistory
-from .bot_config import BotConfig
-from .database import DatabaseManager, get_database_manager
-from .admin_log import AdminActionLog, CommandUsageStats
-from .user_profile import UserProfile, UserProgress, QuizAttempt, UserSession
-from .quiz import Quiz, QuizOption
+Model classes are imported lazily on first attribute access, so importing one
+model module does not load every sibling.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    'Lesson': 'lesson',
+    'PostingHistory': 'posting_history',
+    'BotConfig': 'bot_config',
+    'DatabaseManager': 'database',
+    'get_database_manager': 'database',
+    'AdminActionLog': 'admin_log',
+    'CommandUsageStats': 'admin_log',
+    'UserProfile': 'user_profile',
+    'UserProgress': 'user_profile',
+    'QuizAttempt': 'user_profile',
+    'UserSession': 'user_profile',
+    'Quiz': 'quiz',
+    'QuizOption': 'quiz',
+}
+
+if TYPE_CHECKING:
+    from .lesson import Lesson
+    from .posting_history import PostingHistory
+    from .bot_config import BotConfig
+    from .database import DatabaseManager, get_database_manager
+    from .admin_log import AdminActionLog, CommandUsageStats
+    from .user_profile import UserProfile, UserProgress, QuizAttempt, UserSession
+    from .quiz import Quiz, QuizOption
 
 __all__ = [
     'Lesson',
-    'PostingHistory', 
+    'PostingHistory',
     'BotConfig',
     'DatabaseManager',
     'get_database_manager',
@@ -22,4 +47,19 @@ __all__ = [
     'UserSession',
     'Quiz',
     'QuizOption'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    """Import a model on first access and cache it in the package namespace."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
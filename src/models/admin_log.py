@@ -2,10 +2,13 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 
+from ..utils import json_utils
+from ..utils.datetime_utils import parse_datetime
 
-@dataclass
+
+@dataclass(slots=True)
 class AdminActionLog:
     """Log entry for administrative actions."""
     
@@ -52,10 +55,6 @@ class AdminActionLog:
         Returns:
             AdminActionLog instance
         """
-        timestamp = None
-        if data.get('timestamp'):
-            timestamp = datetime.fromisoformat(data['timestamp'])
-        
         return cls(
             id=data.get('id'),
             admin_user_id=data['admin_user_id'],
@@ -63,13 +62,33 @@ class AdminActionLog:
             action_type=data.get('action_type', ''),
             action_details=data.get('action_details', ''),
             target_user_id=data.get('target_user_id'),
-            timestamp=timestamp,
+            timestamp=parse_datetime(data.get('timestamp')),
             success=data.get('success', True),
             error_message=data.get('error_message')
         )
+    
+    def to_json(self) -> bytes:
+        """Serialize admin log entry to JSON without building an intermediate dict.
+        
+        Returns:
+            UTF-8 encoded JSON with the same fields as to_dict
+        """
+        return json_utils.dumps_model(self)
+    
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]) -> 'AdminActionLog':
+        """Create admin log entry from JSON produced by to_json.
+        
+        Args:
+            data: JSON text or bytes
+            
+        Returns:
+            AdminActionLog instance
+        """
+        return cls.from_dict(json_utils.loads(data))
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandUsageStats:
     """Statistics for command usage tracking."""
     
@@ -114,17 +133,33 @@ class CommandUsageStats:
         Returns:
             CommandUsageStats instance
         """
-        execution_time = None
-        if data.get('execution_time'):
-            execution_time = datetime.fromisoformat(data['execution_time'])
-        
         return cls(
             id=data.get('id'),
             command_name=data.get('command_name', ''),
             user_id=data['user_id'],
             chat_type=data.get('chat_type', ''),
-            execution_time=execution_time,
+            execution_time=parse_datetime(data.get('execution_time')),
             success=data.get('success', True),
             response_time_ms=data.get('response_time_ms', 0),
             error_type=data.get('error_type')
-        )
\ No newline at end of file
+        )
+    
+    def to_json(self) -> bytes:
+        """Serialize command usage stats to JSON without building an intermediate dict.
+        
+        Returns:
+            UTF-8 encoded JSON with the same fields as to_dict
+        """
+        return json_utils.dumps_model(self)
+    
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]) -> 'CommandUsageStats':
+        """Create command usage stats from JSON produced by to_json.
+        
+        Args:
+            data: JSON text or bytes
+            
+        Returns:
+            CommandUsageStats instance
+        """
+        return cls.from_dict(json_utils.loads(data))
\ No newline at end of file
@@ -1,11 +1,15 @@
 """BotConfig data model for storing bot configuration settings."""
 
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
 from dataclasses import dataclass
 
+from ..config import parse_posting_time
+from ..utils import json_utils
+from ..utils.datetime_utils import parse_datetime
 
-@dataclass
+
+@dataclass(slots=True)
 class BotConfig:
     """Data model for bot configuration settings stored in database."""
     
@@ -43,23 +47,26 @@ class BotConfig:
     @classmethod
     def from_dict(cls, data: dict) -> 'BotConfig':
         """Create bot config from dictionary data."""
-        config = cls(
+        return cls(
             id=data.get('id'),
             bot_token=data.get('bot_token', ''),
             channel_id=data.get('channel_id', ''),
             posting_time=data.get('posting_time', '09:00'),
             timezone=data.get('timezone', 'UTC'),
             retry_attempts=data.get('retry_attempts', 3),
-            retry_delay=data.get('retry_delay', 60)
+            retry_delay=data.get('retry_delay', 60),
+            created_at=parse_datetime(data.get('created_at')),
+            updated_at=parse_datetime(data.get('updated_at'))
         )
-        
-        # Parse datetime fields
-        if data.get('created_at'):
-            config.created_at = datetime.fromisoformat(data['created_at'])
-        if data.get('updated_at'):
-            config.updated_at = datetime.fromisoformat(data['updated_at'])
-            
-        return config
+    
+    def to_json(self) -> bytes:
+        """Serialize bot config to JSON bytes without building an intermediate dict."""
+        return json_utils.dumps_model(self)
+    
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]) -> 'BotConfig':
+        """Create bot config from JSON produced by to_json."""
+        return cls.from_dict(json_utils.loads(data))
     
     def validate(self) -> bool:
         """Validate bot configuration settings."""
@@ -74,20 +81,14 @@ class BotConfig:
             raise ValueError("Channel ID is required")
         
         # Validate channel ID format
-        if not (self.channel_id.startswith("@") or self.channel_id.startswith("-")):
+        if not self.channel_id.startswith(("@", "-")):
             raise ValueError("Channel ID must start with @ or -")
         
-        # Validate posting time format (HH:MM)
+        # Validate posting time format and range (HH:MM) with the same rule as Config
         try:
-            time_parts = self.posting_time.split(":")
-            if len(time_parts) != 2:
-                raise ValueError("Posting time must be in HH:MM format")
-            
-            hour, minute = int(time_parts[0]), int(time_parts[1])
-            if not (0 <= hour <= 23) or not (0 <= minute <= 59):
-                raise ValueError("Invalid posting time values")
-        except (ValueError, IndexError) as e:
-            raise ValueError(f"Invalid posting time format: {e}")
+            parse_posting_time(self.posting_time)
+        except ValueError:
+            raise ValueError("Invalid posting time format (use HH:MM)") from None
         
         if not self.timezone or not self.timezone.strip():
             raise ValueError("Timezone is required")
@@ -2,10 +2,13 @@
 
 import sqlite3
 import logging
+import threading
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set
 from contextlib import contextmanager
 from datetime import datetime
+from functools import cache
+from importlib.resources import files
 
 from .lesson import Lesson
 from .posting_history import PostingHistory
@@ -14,100 +17,123 @@ from .bot_config import BotConfig
 
 logger = logging.getLogger(__name__)
 
+# Database directories already created by a DatabaseManager in this process
+_ENSURED_DIRS: Set[Path] = set()
+
 
 class DatabaseManager:
     """Manages SQLite database connections and operations."""
     
-    def __init__(self, db_path: str = "lessons.db"):
-        """Initialize database manager with database path."""
+    # Prepared statements kept per connection; connections are long-lived, so
+    # repeated queries skip re-parsing
+    STATEMENT_CACHE_SIZE = 256
+    
+    # Pages copied per backup step and seconds to pause between steps
+    BACKUP_PAGES_PER_STEP = 64
+    BACKUP_STEP_SLEEP = 0.001
+    
+    _COUNT_LESSONS_SQL = "SELECT COUNT(*) FROM lessons"
+    
+    # Every figure for get_database_stats in one row; the pragma table-valued
+    # functions give the page count and size without separate PRAGMA calls
+    _DATABASE_STATS_SQL = """
+        SELECT
+            (SELECT COUNT(*) FROM lessons),
+            (SELECT COUNT(*) FROM posting_history),
+            (SELECT COUNT(*) FROM bot_config),
+            (SELECT page_count FROM pragma_page_count()) * (SELECT page_size FROM pragma_page_size()),
+            (SELECT posted_at FROM posting_history
+             WHERE success = 1
+             ORDER BY posted_at DESC
+             LIMIT 1)
+    """
+    
+    def __init__(self, db_path: str = "lessons.db", verify_on_init: bool = False):
+        """Initialize database manager with database path.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            verify_on_init: Run the quick integrity and foreign key checks
+                when the schema is initialized
+        """
         self.db_path = Path(db_path)
+        self.verify_on_init = verify_on_init
         self._ensure_database_directory()
         self._initialized = False
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
     
     def _ensure_database_directory(self) -> None:
-        """Ensure the database directory exists."""
-        if self.db_path.parent != Path('.'):
-            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        """Ensure the database directory exists, once per directory per process."""
+        parent = self.db_path.parent
+        if parent != Path('.') and parent not in _ENSURED_DIRS:
+            parent.mkdir(parents=True, exist_ok=True)
+            _ENSURED_DIRS.add(parent)
     
     @contextmanager
     def get_connection(self):
-        """Get database connection with automatic cleanup."""
-        conn = None
-        try:
-            conn = sqlite3.connect(str(self.db_path))
+        """Get this thread's database connection, opening it on first use.
+        
+        Each thread keeps one connection for the lifetime of the manager instead
+        of reconnecting on every call. Work the caller did not commit is rolled
+        back when the outermost block exits, as closing the connection used to do.
+        """
+        local = self._local
+        conn = getattr(local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False,
+                                   cached_statements=self.STATEMENT_CACHE_SIZE)
             conn.row_factory = sqlite3.Row  # Enable dict-like access to rows
+            local.conn = conn
+            local.depth = 0
+            with self._connections_lock:
+                self._connections.append(conn)
+        
+        local.depth += 1
+        try:
             yield conn
         except Exception as e:
-            if conn:
-                conn.rollback()
+            conn.rollback()
             logger.error(f"Database error: {e}")
             raise
         finally:
-            if conn:
+            local.depth -= 1
+            if local.depth == 0 and conn.in_transaction:
+                conn.rollback()
+    
+    @staticmethod
+    def _tuple_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+        """Return a cursor yielding plain tuples, for queries read by column index.
+        
+        The connection's sqlite3.Row factory is only needed for name-based access;
+        setting it on the cursor leaves the shared connection untouched.
+        """
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        return cursor
+    
+    def close(self) -> None:
+        """Close every connection opened by this manager."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
                 conn.close()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to close database connection: {e}")
+        self._local = threading.local()
     
     def initialize_database(self) -> bool:
-        """Initialize database schema and perform integrity checks."""
+        """Initialize database schema, checking integrity if verify_on_init is set."""
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
+                # Create all tables and indexes in one script and one transaction
+                conn.executescript(sqlite_schema_sql())
                 
-                # Create lessons table
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS lessons (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        title TEXT NOT NULL,
-                        content TEXT NOT NULL,
-                        category TEXT NOT NULL CHECK (category IN ('grammar', 'vocabulary', 'common_mistakes')),
-                        difficulty TEXT NOT NULL CHECK (difficulty IN ('beginner', 'intermediate', 'advanced')),
-                        created_at TEXT NOT NULL,
-                        last_used TEXT,
-                        usage_count INTEGER DEFAULT 0,
-                        tags TEXT,  -- JSON array as string
-                        source TEXT DEFAULT 'manual' CHECK (source IN ('manual', 'imported', 'ai_generated')),
-                        UNIQUE(title, content)  -- Prevent exact duplicates
-                    )
-                """)
-                
-                # Create posting_history table
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS posting_history (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        lesson_id INTEGER NOT NULL,
-                        posted_at TEXT NOT NULL,
-                        success BOOLEAN NOT NULL,
-                        error_message TEXT,
-                        retry_count INTEGER DEFAULT 0,
-                        FOREIGN KEY (lesson_id) REFERENCES lessons (id)
-                    )
-                """)
-                
-                # Create bot_config table
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS bot_config (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        bot_token TEXT NOT NULL,
-                        channel_id TEXT NOT NULL,
-                        posting_time TEXT DEFAULT '09:00',
-                        timezone TEXT DEFAULT 'UTC',
-                        retry_attempts INTEGER DEFAULT 3,
-                        retry_delay INTEGER DEFAULT 60,
-                        created_at TEXT NOT NULL,
-                        updated_at TEXT NOT NULL
-                    )
-                """)
-                
-                # Create indexes for better performance
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_lessons_category ON lessons(category)")
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_lessons_last_used ON lessons(last_used)")
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_lessons_usage_count ON lessons(usage_count)")
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_posting_history_lesson_id ON posting_history(lesson_id)")
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_posting_history_posted_at ON posting_history(posted_at)")
-                
-                conn.commit()
-                
-                # Perform integrity check
-                self._perform_integrity_check(cursor)
+                # Integrity checks read the database file, so keep them off startup by default
+                if self.verify_on_init:
+                    self._perform_integrity_check(self._tuple_cursor(conn))
                 
                 self._initialized = True
                 logger.info("Database initialized successfully")
@@ -117,11 +143,17 @@ class DatabaseManager:
             logger.error(f"Failed to initialize database: {e}")
             raise
     
-    def _perform_integrity_check(self, cursor: sqlite3.Cursor) -> None:
-        """Perform database integrity checks."""
+    def _perform_integrity_check(self, cursor: sqlite3.Cursor, full: bool = False) -> None:
+        """Perform database integrity checks.
+        
+        Args:
+            cursor: Cursor to run the checks on
+            full: Run PRAGMA integrity_check instead of the faster quick_check,
+                which skips index-to-table consistency checks
+        """
         try:
             # Check database integrity
-            cursor.execute("PRAGMA integrity_check")
+            cursor.execute("PRAGMA integrity_check" if full else "PRAGMA quick_check")
             result = cursor.fetchone()
             if result[0] != "ok":
                 raise RuntimeError(f"Database integrity check failed: {result[0]}")
@@ -138,12 +170,22 @@ class DatabaseManager:
             logger.error(f"Database integrity check failed: {e}")
             raise
     
+    def verify_full(self) -> bool:
+        """Run the full integrity and foreign key checks, e.g. for scheduled maintenance.
+        
+        Raises:
+            RuntimeError: If the database is corrupt or has foreign key violations
+        """
+        with self.get_connection() as conn:
+            self._perform_integrity_check(self._tuple_cursor(conn), full=True)
+        return True
+    
     def check_lesson_count(self) -> int:
         """Check the number of lessons in the database."""
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM lessons")
+                cursor = self._tuple_cursor(conn)
+                cursor.execute(self._COUNT_LESSONS_SQL)
                 count = cursor.fetchone()[0]
                 return count
         except Exception as e:
@@ -157,7 +199,7 @@ class DatabaseManager:
         
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = self._tuple_cursor(conn)
                 
                 # Check if required tables exist
                 cursor.execute("""
@@ -177,7 +219,7 @@ class DatabaseManager:
         """Validate database schema matches expected structure."""
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = self._tuple_cursor(conn)
                 
                 # Check lessons table structure
                 cursor.execute("PRAGMA table_info(lessons)")
@@ -209,7 +251,7 @@ class DatabaseManager:
                     'id': 'INTEGER',
                     'lesson_id': 'INTEGER',
                     'posted_at': 'TEXT',
-                    'success': 'BOOLEAN',
+                    'success': 'INTEGER',
                     'error_message': 'TEXT',
                     'retry_count': 'INTEGER'
                 }
@@ -253,12 +295,20 @@ class DatabaseManager:
             backup_path_obj = Path(backup_path)
             backup_path_obj.parent.mkdir(parents=True, exist_ok=True)
             
-            # Use explicit connection management to ensure proper cleanup
-            source_conn = sqlite3.connect(str(self.db_path))
+            # Use explicit connection management to ensure proper cleanup;
+            # the source is opened read-only since the backup never writes to it
+            source_conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True)
             backup_conn = sqlite3.connect(str(backup_path_obj))
             
             try:
-                source_conn.backup(backup_conn)
+                # Copy in page batches, pausing between them so writers are not
+                # locked out for the whole backup
+                source_conn.backup(
+                    backup_conn,
+                    pages=self.BACKUP_PAGES_PER_STEP,
+                    sleep=self.BACKUP_STEP_SLEEP,
+                    progress=self._log_backup_progress
+                )
                 logger.info(f"Database backed up to {backup_path}")
                 return True
             finally:
@@ -269,38 +319,21 @@ class DatabaseManager:
             logger.error(f"Failed to backup database: {e}")
             return False
     
+    @staticmethod
+    def _log_backup_progress(status: int, remaining: int, total: int) -> None:
+        """Log backup progress after each batch of pages."""
+        logger.debug(f"Database backup: {total - remaining}/{total} pages copied")
+    
     def get_database_stats(self) -> Dict[str, Any]:
         """Get database statistics and health information."""
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Get table counts
-                cursor.execute("SELECT COUNT(*) FROM lessons")
-                lesson_count = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT COUNT(*) FROM posting_history")
-                history_count = cursor.fetchone()[0]
+                cursor = self._tuple_cursor(conn)
                 
-                cursor.execute("SELECT COUNT(*) FROM bot_config")
-                config_count = cursor.fetchone()[0]
-                
-                # Get database size
-                cursor.execute("PRAGMA page_count")
-                page_count = cursor.fetchone()[0]
-                cursor.execute("PRAGMA page_size")
-                page_size = cursor.fetchone()[0]
-                db_size = page_count * page_size
-                
-                # Get last posting
-                cursor.execute("""
-                    SELECT posted_at FROM posting_history 
-                    WHERE success = 1 
-                    ORDER BY posted_at DESC 
-                    LIMIT 1
-                """)
-                last_success = cursor.fetchone()
-                last_successful_post = last_success[0] if last_success else None
+                # Table counts, database size and last posting in one query
+                cursor.execute(self._DATABASE_STATS_SQL)
+                (lesson_count, history_count, config_count,
+                 db_size, last_successful_post) = cursor.fetchone()
                 
                 return {
                     'lesson_count': lesson_count,
@@ -317,6 +350,12 @@ class DatabaseManager:
             return {}
 
 
+@cache
+def sqlite_schema_sql() -> str:
+    """Return the SQL script that creates the SQLite tables and indexes."""
+    return files('src.sql').joinpath('sqlite_schema.sql').read_text(encoding='utf-8')
+
+
 # Global database manager instance
 _db_manager = None
 
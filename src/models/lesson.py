@@ -1,12 +1,34 @@
 """Lesson data model for storing English lesson content."""
 
+from bisect import bisect_right, insort
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass, field
 import json
 
+from ..utils import json_utils
+from ..utils.datetime_utils import parse_datetime
 
-@dataclass
+# Allowed values for the constrained lesson fields, in display order
+_CATEGORIES = ('grammar', 'vocabulary', 'common_mistakes')
+_DIFFICULTIES = ('beginner', 'intermediate', 'advanced')
+_SOURCES = ('manual', 'imported', 'ai_generated')
+
+_VALID_CATEGORIES = frozenset(_CATEGORIES)
+_VALID_DIFFICULTIES = frozenset(_DIFFICULTIES)
+_VALID_SOURCES = frozenset(_SOURCES)
+
+_CATEGORY_ERROR = f"Category must be one of: {list(_CATEGORIES)}"
+_DIFFICULTY_ERROR = f"Difficulty must be one of: {list(_DIFFICULTIES)}"
+_SOURCE_ERROR = f"Source must be one of: {list(_SOURCES)}"
+
+
+def _text_key(text: str) -> str:
+    """Normalize a title or content for case-insensitive duplicate checks."""
+    return text.casefold().strip()
+
+
+@dataclass(slots=True)
 class Lesson:
     """Data model for English lesson content."""
     
@@ -21,10 +43,16 @@ class Lesson:
     tags: List[str] = field(default_factory=list)
     source: str = "manual"  # 'manual', 'imported', 'ai_generated'
     
+    # Normalized title and content for duplicate checks, taken at construction
+    _title_key: str = field(default="", init=False, repr=False, compare=False)
+    _content_key: str = field(default="", init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Initialize default values after object creation."""
         if self.created_at is None:
             self.created_at = datetime.utcnow()
+        self._title_key = _text_key(self.title)
+        self._content_key = _text_key(self.content)
     
     def to_dict(self) -> dict:
         """Convert lesson to dictionary for JSON serialization."""
@@ -44,50 +72,67 @@ class Lesson:
     @classmethod
     def from_dict(cls, data: dict) -> 'Lesson':
         """Create lesson from dictionary data."""
-        lesson = cls(
+        return cls(
             id=data.get('id'),
             title=data.get('title', ''),
             content=data.get('content', ''),
             category=data.get('category', ''),
             difficulty=data.get('difficulty', ''),
+            created_at=parse_datetime(data.get('created_at')),
+            last_used=parse_datetime(data.get('last_used')),
             usage_count=data.get('usage_count', 0),
             tags=data.get('tags', []),
             source=data.get('source', 'manual')
         )
-        
-        # Parse datetime fields
-        if data.get('created_at'):
-            lesson.created_at = datetime.fromisoformat(data['created_at'])
-        if data.get('last_used'):
-            lesson.last_used = datetime.fromisoformat(data['last_used'])
-            
-        return lesson
     
-    def validate(self) -> bool:
-        """Validate lesson content and metadata."""
-        if not self.title or not self.title.strip():
-            raise ValueError("Lesson title is required")
+    def to_json(self) -> bytes:
+        """Serialize lesson to JSON bytes without building an intermediate dict."""
+        return json_utils.dumps_model(self)
+    
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]) -> 'Lesson':
+        """Create lesson from JSON produced by to_json."""
+        return cls.from_dict(json_utils.loads(data))
+    
+    @staticmethod
+    def field_errors(title: str, content: str, category: str, difficulty: str,
+                     source: str = "manual", tags: Any = (), usage_count: int = 0) -> List[str]:
+        """Return validation problems for raw lesson field values without raising."""
+        errors = []
+        
+        if not title or not title.strip():
+            errors.append("Lesson title is required")
         
-        if not self.content or not self.content.strip():
-            raise ValueError("Lesson content is required")
+        if not content or not content.strip():
+            errors.append("Lesson content is required")
         
-        valid_categories = ['grammar', 'vocabulary', 'common_mistakes']
-        if self.category not in valid_categories:
-            raise ValueError(f"Category must be one of: {valid_categories}")
+        if category not in _VALID_CATEGORIES:
+            errors.append(_CATEGORY_ERROR)
         
-        valid_difficulties = ['beginner', 'intermediate', 'advanced']
-        if self.difficulty not in valid_difficulties:
-            raise ValueError(f"Difficulty must be one of: {valid_difficulties}")
+        if difficulty not in _VALID_DIFFICULTIES:
+            errors.append(_DIFFICULTY_ERROR)
         
-        valid_sources = ['manual', 'imported', 'ai_generated']
-        if self.source not in valid_sources:
-            raise ValueError(f"Source must be one of: {valid_sources}")
+        if source not in _VALID_SOURCES:
+            errors.append(_SOURCE_ERROR)
         
-        if not isinstance(self.tags, list):
-            raise ValueError("Tags must be a list")
+        if not isinstance(tags, list):
+            errors.append("Tags must be a list")
         
-        if self.usage_count < 0:
-            raise ValueError("Usage count cannot be negative")
+        if usage_count < 0:
+            errors.append("Usage count cannot be negative")
+        
+        return errors
+    
+    def validate_errors(self) -> List[str]:
+        """Return every validation problem with this lesson without raising."""
+        return self.field_errors(self.title, self.content, self.category, self.difficulty,
+                                 self.source, self.tags, self.usage_count)
+    
+    def validate(self) -> bool:
+        """Validate lesson content and metadata."""
+        errors = self.validate_errors()
+        if errors:
+            raise ValueError(errors[0])
         
         return True
     
@@ -101,27 +146,85 @@ class Lesson:
         if not isinstance(other, Lesson):
             return False
         
+        return self._keys_are_similar(self._title_key, self._content_key,
+                                      other._title_key, other._content_key)
+    
+    @staticmethod
+    def texts_are_similar(title: str, content: str, other_title: str, other_content: str) -> bool:
+        """Check whether two lessons' titles and contents look like duplicates."""
+        return Lesson._keys_are_similar(_text_key(title), _text_key(content),
+                                        _text_key(other_title), _text_key(other_content))
+    
+    @staticmethod
+    def _keys_are_similar(title_key: str, content_key: str,
+                          other_title_key: str, other_content_key: str) -> bool:
+        """Apply the duplicate rule to titles and contents already passed through _text_key."""
         # Check title similarity (case-insensitive)
-        if self.title.lower().strip() == other.title.lower().strip():
+        if title_key == other_title_key:
             return True
         
-        # Check content similarity (basic check for now)
-        self_content = self.content.lower().strip()
-        other_content = other.content.lower().strip()
-        
         # If content is identical, it's a duplicate
-        if self_content == other_content:
+        if content_key == other_content_key:
             return True
         
         # Check for substantial overlap (simple heuristic)
-        if len(self_content) > 50 and len(other_content) > 50:
+        if len(content_key) > 50 and len(other_content_key) > 50:
             # Check if one content contains most of the other
-            shorter = min(self_content, other_content, key=len)
-            longer = max(self_content, other_content, key=len)
+            shorter, longer = sorted((content_key, other_content_key), key=len)
             
             if len(shorter) > 0 and len(longer) > 0:
                 overlap_ratio = len(shorter) / len(longer)
                 if overlap_ratio > 0.8 and shorter in longer:
                     return True
         
-        return False
\ No newline at end of file
+        return False
+
+
+class LessonSimilarityIndex:
+    """Duplicate lookup for many lessons using the rule in Lesson.texts_are_similar.
+    
+    Normalized titles and contents are kept in sets for exact matches, and long
+    contents in a length-sorted list so the overlap check only visits contents
+    whose length is within the 0.8 ratio, instead of every known lesson.
+
+    Answers are exactly those of texts_are_similar; an approximate sketch such
+    as MinHash would change which lessons count as duplicates.
+    """
+    
+    def __init__(self):
+        self._titles: Set[str] = set()
+        self._contents: Set[str] = set()
+        self._long_contents: List[Tuple[int, str]] = []
+    
+    def add(self, title: str, content: str) -> None:
+        """Record a lesson's title and content."""
+        self._titles.add(_text_key(title))
+        content = _text_key(content)
+        if content not in self._contents:
+            self._contents.add(content)
+            if len(content) > 50:
+                insort(self._long_contents, (len(content), content))
+    
+    def is_similar(self, title: str, content: str) -> bool:
+        """Check whether a lesson looks like a duplicate of any recorded lesson."""
+        if _text_key(title) in self._titles:
+            return True
+        
+        content = _text_key(content)
+        if content in self._contents:
+            return True
+        
+        length = len(content)
+        if length <= 50:
+            return False
+        
+        # Only contents with 0.8 * length < other < length / 0.8 can pass the ratio test
+        start = bisect_right(self._long_contents, (int(length * 0.8), ''))
+        for other_length, other in self._long_contents[start:]:
+            if other_length * 0.8 >= length:
+                break
+            shorter, longer = (content, other) if length <= other_length else (other, content)
+            if len(shorter) / len(longer) > 0.8 and shorter in longer:
+                return True
+        
+        return False
@@ -1,11 +1,14 @@
 """PostingHistory data model for tracking lesson posting attempts."""
 
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
 from dataclasses import dataclass
 
+from ..utils import json_utils
+from ..utils.datetime_utils import parse_datetime
 
-@dataclass
+
+@dataclass(slots=True)
 class PostingHistory:
     """Data model for tracking lesson posting history and attempts."""
     
@@ -15,6 +18,8 @@ class PostingHistory:
     success: bool = False
     error_message: Optional[str] = None
     retry_count: int = 0
+    message_id: Optional[int] = None
+    correlation_id: Optional[str] = None
     
     def __post_init__(self):
         """Initialize default values after object creation."""
@@ -29,25 +34,33 @@ class PostingHistory:
             'posted_at': self.posted_at.isoformat() if self.posted_at else None,
             'success': self.success,
             'error_message': self.error_message,
-            'retry_count': self.retry_count
+            'retry_count': self.retry_count,
+            'message_id': self.message_id,
+            'correlation_id': self.correlation_id
         }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'PostingHistory':
         """Create posting history from dictionary data."""
-        history = cls(
+        return cls(
             id=data.get('id'),
             lesson_id=data.get('lesson_id', 0),
-            success=data.get('success', False),
+            posted_at=parse_datetime(data.get('posted_at')),
+            success=bool(data.get('success', False)),
             error_message=data.get('error_message'),
-            retry_count=data.get('retry_count', 0)
+            retry_count=data.get('retry_count', 0),
+            message_id=data.get('message_id'),
+            correlation_id=data.get('correlation_id')
         )
-        
-        # Parse datetime field
-        if data.get('posted_at'):
-            history.posted_at = datetime.fromisoformat(data['posted_at'])
-            
-        return history
+    
+    def to_json(self) -> bytes:
+        """Serialize posting history to JSON bytes without building an intermediate dict."""
+        return json_utils.dumps_model(self)
+    
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]) -> 'PostingHistory':
+        """Create posting history from JSON produced by to_json."""
+        return cls.from_dict(json_utils.loads(data))
     
     def validate(self) -> bool:
         """Validate posting history data."""
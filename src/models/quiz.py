@@ -1,12 +1,14 @@
 """Quiz model for lesson-based quizzes."""
 
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Any, Union
 from datetime import datetime
-import json
 
+from ..utils import json_utils
+from ..utils.datetime_utils import parse_datetime
 
-@dataclass
+
+@dataclass(slots=True)
 class QuizOption:
     """Represents a quiz option/answer choice."""
     text: str
@@ -14,7 +16,7 @@ class QuizOption:
     explanation: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Quiz:
     """Represents a quiz based on a lesson."""
     id: Optional[int] = None
@@ -26,85 +28,127 @@ class Quiz:
     created_at: Optional[datetime] = None
     usage_count: int = 0
     
+    # Index of the correct option, recomputed by __post_init__, set_options()
+    # and validate(); replace options through set_options() rather than in place
+    _correct_index: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    # to_dict() result, reused until mark_dirty() is called
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         if self.options is None:
             self.options = []
         if self.created_at is None:
             self.created_at = datetime.utcnow()
+        self._correct_index = self._find_correct_index()
+    
+    def _find_correct_index(self) -> Optional[int]:
+        """Scan options for the first correct one."""
+        return next((i for i, option in enumerate(self.options) if option.is_correct), None)
+    
+    def set_options(self, options: List[QuizOption]) -> None:
+        """Replace the options and recompute the correct option."""
+        self.options = options
+        self._correct_index = self._find_correct_index()
+        self.mark_dirty()
+    
+    def mark_dirty(self) -> None:
+        """Drop the cached to_dict() result after changing a field."""
+        self._dict_cache = None
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert quiz to dictionary."""
+        """Convert quiz to dictionary.
+        
+        Quizzes are treated as immutable once built, so the field values are
+        formatted once and cached; call mark_dirty() after changing a field.
+        Each call returns a new dictionary (with new option dicts), so callers
+        may modify the result without affecting the cache.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'id': self.id,
+                'lesson_id': self.lesson_id,
+                'question': self.question,
+                'options': [
+                    {
+                        'text': opt.text,
+                        'is_correct': opt.is_correct,
+                        'explanation': opt.explanation
+                    }
+                    for opt in self.options
+                ],
+                'explanation': self.explanation,
+                'difficulty': self.difficulty,
+                'created_at': self.created_at.isoformat() if self.created_at else None,
+                'usage_count': self.usage_count
+            }
         return {
-            'id': self.id,
-            'lesson_id': self.lesson_id,
-            'question': self.question,
-            'options': [
-                {
-                    'text': opt.text,
-                    'is_correct': opt.is_correct,
-                    'explanation': opt.explanation
-                }
-                for opt in self.options
-            ],
-            'explanation': self.explanation,
-            'difficulty': self.difficulty,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'usage_count': self.usage_count
+            **self._dict_cache,
+            'options': [dict(option) for option in self._dict_cache['options']]
         }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Quiz':
         """Create quiz from dictionary."""
-        options = []
-        for opt_data in data.get('options', []):
-            options.append(QuizOption(
-                text=opt_data['text'],
-                is_correct=opt_data['is_correct'],
-                explanation=opt_data.get('explanation')
-            ))
-        
         return cls(
             id=data.get('id'),
             lesson_id=data.get('lesson_id'),
             question=data.get('question', ''),
-            options=options,
+            options=[
+                QuizOption(
+                    text=opt_data['text'],
+                    is_correct=opt_data['is_correct'],
+                    explanation=opt_data.get('explanation')
+                )
+                for opt_data in data.get('options', ())
+            ],
             explanation=data.get('explanation', ''),
             difficulty=data.get('difficulty', 'intermediate'),
-            created_at=datetime.fromisoformat(data['created_at']) if data.get('created_at') else None,
+            created_at=parse_datetime(data.get('created_at')),
             usage_count=data.get('usage_count', 0)
         )
     
+    def to_json(self) -> bytes:
+        """Serialize quiz to JSON bytes without building an intermediate dict."""
+        return json_utils.dumps_model(self)
+    
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]) -> 'Quiz':
+        """Create quiz from JSON produced by to_json."""
+        return cls.from_dict(json_utils.loads(data))
+    
     def get_correct_option_index(self) -> Optional[int]:
         """Get the index of the correct option (0-based)."""
-        for i, option in enumerate(self.options):
-            if option.is_correct:
-                return i
-        return None
+        return self._correct_index
     
     def get_correct_option(self) -> Optional[QuizOption]:
         """Get the correct option."""
-        for option in self.options:
-            if option.is_correct:
-                return option
-        return None
+        if self._correct_index is None:
+            return None
+        return self.options[self._correct_index]
     
     def validate(self) -> bool:
         """Validate quiz data."""
         if not self.question.strip():
             raise ValueError("Quiz question cannot be empty")
         
-        if len(self.options) < 2:
+        option_count = len(self.options)
+        if option_count < 2:
             raise ValueError("Quiz must have at least 2 options")
         
-        if len(self.options) > 10:
+        if option_count > 10:
             raise ValueError("Quiz cannot have more than 10 options")
         
-        correct_count = sum(1 for opt in self.options if opt.is_correct)
-        if correct_count != 1:
-            raise ValueError("Quiz must have exactly one correct answer")
-        
-        for option in self.options:
+        correct_index = None
+        correct_count = 0
+        for i, option in enumerate(self.options):
             if not option.text.strip():
                 raise ValueError("Quiz option text cannot be empty")
+            if option.is_correct:
+                correct_count += 1
+                correct_index = i
+        
+        if correct_count != 1:
+            raise ValueError("Quiz must have exactly one correct answer")
         
+        self._correct_index = correct_index
         return True
\ No newline at end of file
@@ -2,17 +2,78 @@
 
 import os
 import logging
+import threading
+import time
 import requests
-from typing import Optional, List, Dict, Any
+from requests.adapters import HTTPAdapter
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from functools import cache, lru_cache, wraps
+from importlib.resources import files
+from typing import Optional, List, Dict, Any, Iterator
 from datetime import datetime, timedelta
 
 from .lesson import Lesson
 from .posting_history import PostingHistory
+from ..utils.datetime_utils import parse_datetime
+from ..utils.json_utils import dumps_bytes
 
 
 logger = logging.getLogger(__name__)
 
 
+# Rows share many timestamps (bulk imports, same-day usage), so parsed values
+# are cached per string; datetimes are immutable and safe to share.
+@lru_cache(maxsize=4096)
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a PostgREST timestamp, returning None for missing values."""
+    return parse_datetime(value)
+
+
+def _copy_lessons(lessons: List[Lesson]) -> List[Lesson]:
+    """Copy cached lessons, including their tag lists, for a caller to own."""
+    return [replace(lesson, tags=list(lesson.tags)) for lesson in lessons]
+
+
+def _cached_read(method):
+    """Serve repeated calls with the same arguments from the manager's read cache.
+    
+    Only non-empty lists are cached, since the read methods also return [] on
+    request errors. Callers get a new list of copied lessons every time, so
+    mutating a returned lesson (e.g. mark_used) cannot change what later
+    callers read from the cache.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with self._read_cache_lock:
+            entry = self._read_cache.get(key)
+            if entry and entry[0] > now:
+                return _copy_lessons(entry[1])
+        
+        result = method(self, *args, **kwargs)
+        if result:
+            with self._read_cache_lock:
+                if len(self._read_cache) >= self.READ_CACHE_SIZE:
+                    self._read_cache.clear()
+                self._read_cache[key] = (now + self.READ_CACHE_TTL, result)
+        return _copy_lessons(result)
+    return wrapper
+
+
+def _invalidates_reads(method):
+    """Clear the manager's read cache after a write, whether or not it succeeded."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.clear_read_cache()
+    return wrapper
+
+
 class SupabaseManager:
     """Manages Supabase database connections and operations using HTTP requests."""
     
@@ -31,8 +92,38 @@ class SupabaseManager:
             'Content-Type': 'application/json',
             'Prefer': 'return=representation'
         }
+        self.session = self._create_session()
+        self._read_cache: Dict[tuple, tuple] = {}
+        self._read_cache_lock = threading.Lock()
         self._initialized = False
     
+    # Keep-alive connections held per host; matches the bulk insert fallback workers
+    POOL_SIZE = 8
+    
+    # Columns read by _row_to_lesson; leaves out search_tsv, which is as large as the content
+    LESSON_COLUMNS = "id,title,content,category,difficulty,tags,source,created_at,last_used,usage_count"
+    
+    # Lesson lists kept for repeated reads; every lesson write clears them
+    READ_CACHE_SIZE = 128
+    READ_CACHE_TTL = 30.0
+    
+    def _create_session(self) -> requests.Session:
+        """Create a pooled HTTP session so requests reuse keep-alive connections."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.POOL_SIZE)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def close(self) -> None:
+        """Close the pooled HTTP session."""
+        self.session.close()
+    
+    def clear_read_cache(self) -> None:
+        """Drop cached lesson lists so the next reads go to Supabase."""
+        with self._read_cache_lock:
+            self._read_cache.clear()
+    
     def is_initialized(self) -> bool:
         """Check if database is properly initialized."""
         return self._initialized
@@ -40,7 +131,7 @@ class SupabaseManager:
     def test_connection(self) -> bool:
         """Test database connection."""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/lessons?select=id&limit=1",
                 headers=self.headers,
                 timeout=10
@@ -52,25 +143,34 @@ class SupabaseManager:
             return False
     
     # Lesson operations
+    def _lesson_to_row(self, lesson: Lesson, now: Optional[str] = None) -> Dict[str, Any]:
+        """Convert Lesson object to a row payload for insertion.
+        
+        Args:
+            lesson: Lesson to convert
+            now: ISO timestamp used when the lesson has no created_at, so a
+                batch of rows can share one
+        """
+        return {
+            'title': lesson.title,
+            'content': lesson.content,
+            'category': lesson.category,
+            'difficulty': lesson.difficulty,
+            'tags': lesson.tags,
+            'source': getattr(lesson, 'source', None),
+            'created_at': lesson.created_at.isoformat() if lesson.created_at else now or datetime.utcnow().isoformat(),
+            'last_used': lesson.last_used.isoformat() if lesson.last_used else None,
+            'usage_count': lesson.usage_count or 0
+        }
+    
+    @_invalidates_reads
     def create_lesson(self, lesson: Lesson) -> Optional[int]:
         """Create a new lesson."""
         try:
-            lesson_data = {
-                'title': lesson.title,
-                'content': lesson.content,
-                'category': lesson.category,
-                'difficulty': lesson.difficulty,
-                'tags': lesson.tags,
-                'source': getattr(lesson, 'source', None),
-                'created_at': lesson.created_at.isoformat() if lesson.created_at else datetime.utcnow().isoformat(),
-                'last_used': lesson.last_used.isoformat() if lesson.last_used else None,
-                'usage_count': lesson.usage_count or 0
-            }
-            
-            response = requests.post(
-                f"{self.base_url}/lessons",
+            response = self.session.post(
+                f"{self.base_url}/lessons?select=id",
                 headers=self.headers,
-                json=lesson_data,
+                data=dumps_bytes(self._lesson_to_row(lesson)),
                 timeout=10
             )
             
@@ -88,11 +188,80 @@ class SupabaseManager:
             logger.error(f"Failed to create lesson: {e}")
             return None
     
+    # Rows per bulk insert request
+    BULK_INSERT_CHUNK_SIZE = 1000
+    
+    def _insert_lesson_chunk(self, chunk: List[Lesson]) -> bool:
+        """Insert a chunk of lessons with one request, without returning the rows."""
+        now = datetime.utcnow().isoformat()
+        try:
+            response = self.session.post(
+                f"{self.base_url}/lessons",
+                headers={**self.headers, 'Prefer': 'return=minimal'},
+                data=dumps_bytes([self._lesson_to_row(lesson, now) for lesson in chunk]),
+                timeout=30
+            )
+            
+            if response.status_code in [200, 201, 204]:
+                return True
+            
+            logger.error(f"Bulk lesson insert failed: {response.status_code} - {response.text}")
+            return False
+            
+        except Exception as e:
+            logger.error(f"Bulk lesson insert failed: {e}")
+            return False
+    
+    @_invalidates_reads
+    def create_lessons(self, lessons: List[Lesson]) -> int:
+        """Create multiple lessons with bulk insert requests.
+        
+        PostgREST accepts a JSON array body, so each chunk of up to
+        BULK_INSERT_CHUNK_SIZE rows is inserted in one round-trip, with up to
+        POOL_SIZE chunks in flight at once. A chunk is inserted atomically;
+        lessons from failed chunks are retried one by one.
+        
+        Returns:
+            Number of lessons created
+        """
+        if not lessons:
+            return 0
+        
+        chunks = [
+            lessons[start:start + self.BULK_INSERT_CHUNK_SIZE]
+            for start in range(0, len(lessons), self.BULK_INSERT_CHUNK_SIZE)
+        ]
+        if len(chunks) == 1:
+            results = [self._insert_lesson_chunk(chunks[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.POOL_SIZE, len(chunks))) as executor:
+                results = list(executor.map(self._insert_lesson_chunk, chunks))
+        
+        created_count = 0
+        failed = []
+        for chunk, inserted in zip(chunks, results):
+            if inserted:
+                created_count += len(chunk)
+            else:
+                failed.extend(chunk)
+        
+        # Fall back to individual inserts for chunks the bulk request did not create.
+        # Each insert is independent and I/O-bound, so overlap them in a thread pool.
+        if failed:
+            with ThreadPoolExecutor(max_workers=min(self.POOL_SIZE, len(failed))) as executor:
+                futures = {executor.submit(self.create_lesson, lesson): lesson for lesson in failed}
+                for future in as_completed(futures):
+                    if future.result() is not None:
+                        created_count += 1
+        
+        logger.info(f"Created {created_count}/{len(lessons)} lessons")
+        return created_count
+    
     def get_lesson_by_id(self, lesson_id: int) -> Optional[Lesson]:
         """Get lesson by ID."""
         try:
-            response = requests.get(
-                f"{self.base_url}/lessons?id=eq.{lesson_id}",
+            response = self.session.get(
+                f"{self.base_url}/lessons?select={self.LESSON_COLUMNS}&id=eq.{lesson_id}",
                 headers=self.headers,
                 timeout=10
             )
@@ -108,31 +277,96 @@ class SupabaseManager:
             logger.error(f"Failed to get lesson {lesson_id}: {e}")
             return None
     
-    def get_all_lessons(self) -> List[Lesson]:
-        """Get all lessons."""
+    # IDs per id=in.(...) filter, keeping request URLs well under server limits
+    IDS_PER_REQUEST = 200
+    
+    def get_lessons_by_ids(self, lesson_ids: List[int]) -> List[Lesson]:
+        """Get lessons by ID with one id=in.(...) request per IDS_PER_REQUEST IDs.
+        
+        Returns:
+            Lessons found, ordered by ID; missing IDs are skipped
+        """
+        lessons = []
+        ids = [int(lesson_id) for lesson_id in dict.fromkeys(lesson_ids)]
+        for start in range(0, len(ids), self.IDS_PER_REQUEST):
+            joined = ",".join(map(str, ids[start:start + self.IDS_PER_REQUEST]))
+            try:
+                response = self.session.get(
+                    f"{self.base_url}/lessons?select={self.LESSON_COLUMNS}&id=in.({joined})&order=id",
+                    headers=self.headers,
+                    timeout=10
+                )
+                
+                if response.status_code == 200:
+                    lessons.extend(self._row_to_lesson(row) for row in response.json())
+                else:
+                    logger.error(f"Failed to get lessons by IDs: {response.status_code}")
+                    
+            except Exception as e:
+                logger.error(f"Failed to get lessons by IDs: {e}")
+        
+        return lessons
+    
+    # Rows per page when walking the whole lessons table; below PostgREST's max-rows cap
+    LESSON_PAGE_SIZE = 500
+    
+    def _get_lesson_page(self, offset: int, limit: int) -> Optional[List[Lesson]]:
+        """Get one page of lessons in creation order, or None if the request failed."""
         try:
-            response = requests.get(
-                f"{self.base_url}/lessons?order=created_at",
+            response = self.session.get(
+                f"{self.base_url}/lessons?select={self.LESSON_COLUMNS}"
+                f"&order=created_at,id&offset={offset}&limit={limit}",
                 headers=self.headers,
                 timeout=10
             )
             
             if response.status_code == 200:
-                data = response.json()
-                return [self._row_to_lesson(row) for row in data]
+                return [self._row_to_lesson(row) for row in response.json()]
             
             logger.error(f"Failed to get lessons: {response.status_code}")
-            return []
+            return None
             
         except Exception as e:
-            logger.error(f"Failed to get all lessons: {e}")
-            return []
+            logger.error(f"Failed to get lessons at offset {offset}: {e}")
+            return None
+    
+    def iter_all_lessons(self, page_size: Optional[int] = None) -> Iterator[Lesson]:
+        """Yield all lessons in creation order, fetching one page at a time.
+        
+        Stops early if a page request fails.
+        """
+        page_size = page_size or self.LESSON_PAGE_SIZE
+        offset = 0
+        while True:
+            page = self._get_lesson_page(offset, page_size)
+            if not page:
+                return
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += page_size
+    
+    @_cached_read
+    def get_all_lessons(self) -> List[Lesson]:
+        """Get all lessons, paging past the server's per-request row limit."""
+        lessons = []
+        offset = 0
+        while True:
+            page = self._get_lesson_page(offset, self.LESSON_PAGE_SIZE)
+            if page is None:
+                return []
+            lessons.extend(page)
+            if len(page) < self.LESSON_PAGE_SIZE:
+                return lessons
+            offset += self.LESSON_PAGE_SIZE
     
+    @_cached_read
     def get_lessons_by_category(self, category: str) -> List[Lesson]:
         """Get lessons by category."""
         try:
-            response = requests.get(
-                f"{self.base_url}/lessons?category=eq.{category}",
+            response = self.session.get(
+                f"{self.base_url}/lessons",
+                params={'select': self.LESSON_COLUMNS, 'category': f"eq.{category}"},
                 headers=self.headers,
                 timeout=10
             )
@@ -147,40 +381,65 @@ class SupabaseManager:
             logger.error(f"Failed to get lessons by category {category}: {e}")
             return []
     
+    @_invalidates_reads
     def update_lesson_usage(self, lesson_id: int) -> bool:
-        """Update lesson usage statistics."""
+        """Update lesson usage statistics.
+        
+        Uses the increment_lesson_usage function from schema.sql, which bumps the
+        count in one atomic request. Projects whose schema predates the function
+        fall back to reading and patching the count.
+        """
         try:
-            # Get current usage count
-            response = requests.get(
-                f"{self.base_url}/lessons?id=eq.{lesson_id}&select=usage_count",
+            response = self.session.post(
+                f"{self.base_url}/rpc/increment_lesson_usage",
                 headers=self.headers,
+                data=dumps_bytes({'p_id': lesson_id}),
                 timeout=10
             )
             
-            if response.status_code != 200 or not response.json():
-                return False
-            
-            current_count = response.json()[0].get('usage_count', 0)
-            
-            # Update usage
-            update_data = {
-                'usage_count': current_count + 1,
-                'last_used': datetime.utcnow().isoformat()
-            }
+            if response.status_code != 404:
+                return response.status_code in [200, 204]
             
-            update_response = requests.patch(
-                f"{self.base_url}/lessons?id=eq.{lesson_id}",
-                headers=self.headers,
-                json=update_data,
-                timeout=10
-            )
-            
-            return update_response.status_code in [200, 204]
+            logger.warning("increment_lesson_usage is missing; re-run src/sql/schema.sql in Supabase")
+            return self._update_lesson_usage_fallback(lesson_id)
             
         except Exception as e:
             logger.error(f"Failed to update lesson usage for {lesson_id}: {e}")
             return False
     
+    def _update_lesson_usage_fallback(self, lesson_id: int) -> bool:
+        """Update lesson usage with a read and a patch (not atomic)."""
+        # Get current usage count
+        response = self.session.get(
+            f"{self.base_url}/lessons?id=eq.{lesson_id}&select=usage_count",
+            headers=self.headers,
+            timeout=10
+        )
+        
+        if response.status_code != 200:
+            return False
+        
+        rows = response.json()
+        if not rows:
+            return False
+        
+        current_count = rows[0].get('usage_count', 0)
+        
+        # Update usage
+        update_data = {
+            'usage_count': current_count + 1,
+            'last_used': datetime.utcnow().isoformat()
+        }
+        
+        update_response = self.session.patch(
+            f"{self.base_url}/lessons?id=eq.{lesson_id}",
+            headers=self.headers,
+            data=dumps_bytes(update_data),
+            timeout=10
+        )
+        
+        return update_response.status_code in [200, 204]
+    
     def _row_to_lesson(self, row: Dict[str, Any]) -> Lesson:
         """Convert database row to Lesson object."""
         return Lesson(
@@ -191,26 +450,34 @@ class SupabaseManager:
             difficulty=row['difficulty'],
             tags=row.get('tags', []),
             source=row.get('source'),
-            created_at=datetime.fromisoformat(row['created_at'].replace('Z', '+00:00')) if row.get('created_at') else None,
-            last_used=datetime.fromisoformat(row['last_used'].replace('Z', '+00:00')) if row.get('last_used') else None,
+            created_at=_parse_timestamp(row.get('created_at')),
+            last_used=_parse_timestamp(row.get('last_used')),
             usage_count=row.get('usage_count', 0)
         )
     
     # Posting history operations
-    def record_posting(self, lesson_id: int, message_id: int, channel_id: str = None) -> bool:
-        """Record a lesson posting."""
+    def record_posting(self, lesson_id: int, message_id: int, channel_id: str = None,
+                       posted_at: Optional[datetime] = None) -> bool:
+        """Record a lesson posting.
+        
+        Args:
+            lesson_id: Posted lesson
+            message_id: Telegram message ID of the post
+            channel_id: Channel the lesson was posted to
+            posted_at: Posting time shared by a batch of postings; defaults to now
+        """
         try:
             posting_data = {
                 'lesson_id': lesson_id,
                 'message_id': message_id,
                 'channel_id': channel_id,
-                'posted_at': datetime.utcnow().isoformat()
+                'posted_at': (posted_at or datetime.utcnow()).isoformat()
             }
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/posting_history",
                 headers=self.headers,
-                json=posting_data,
+                data=dumps_bytes(posting_data),
                 timeout=10
             )
             
@@ -223,7 +490,7 @@ class SupabaseManager:
     def get_posting_history(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get posting history."""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/posting_history?order=posted_at.desc&limit={limit}",
                 headers=self.headers,
                 timeout=10
@@ -238,11 +505,13 @@ class SupabaseManager:
             logger.error(f"Failed to get posting history: {e}")
             return []
     
+    @_cached_read
     def get_lessons_by_difficulty(self, difficulty: str) -> List[Lesson]:
         """Get lessons by difficulty."""
         try:
-            response = requests.get(
-                f"{self.base_url}/lessons?difficulty=eq.{difficulty}",
+            response = self.session.get(
+                f"{self.base_url}/lessons",
+                params={'select': self.LESSON_COLUMNS, 'difficulty': f"eq.{difficulty}"},
                 headers=self.headers,
                 timeout=10
             )
@@ -262,8 +531,8 @@ class SupabaseManager:
         try:
             cutoff_date = (datetime.utcnow() - timedelta(days=days)).isoformat()
             
-            response = requests.get(
-                f"{self.base_url}/lessons?or=(last_used.is.null,last_used.lt.{cutoff_date})",
+            response = self.session.get(
+                f"{self.base_url}/lessons?select={self.LESSON_COLUMNS}&or=(last_used.is.null,last_used.lt.{cutoff_date})",
                 headers=self.headers,
                 timeout=10
             )
@@ -281,8 +550,8 @@ class SupabaseManager:
     def get_unused_lessons(self) -> List[Lesson]:
         """Get lessons that have never been used (usage_count = 0 or last_used is null)."""
         try:
-            response = requests.get(
-                f"{self.base_url}/lessons?or=(last_used.is.null,usage_count.eq.0)",
+            response = self.session.get(
+                f"{self.base_url}/lessons?select={self.LESSON_COLUMNS}&or=(last_used.is.null,usage_count.eq.0)",
                 headers=self.headers,
                 timeout=10
             )
@@ -300,8 +569,8 @@ class SupabaseManager:
     def get_least_recently_used_lesson(self) -> Optional[Lesson]:
         """Get the lesson that was used least recently."""
         try:
-            response = requests.get(
-                f"{self.base_url}/lessons?order=last_used.asc.nullsfirst,usage_count.asc&limit=1",
+            response = self.session.get(
+                f"{self.base_url}/lessons?select={self.LESSON_COLUMNS}&order=last_used.asc.nullsfirst,usage_count.asc&limit=1",
                 headers=self.headers,
                 timeout=10
             )
@@ -317,11 +586,12 @@ class SupabaseManager:
             logger.error(f"Failed to get least recently used lesson: {e}")
             return None
     
+    @_cached_read
     def get_least_used_lessons(self, limit: int = 10) -> List[Lesson]:
         """Get the least used lessons."""
         try:
-            response = requests.get(
-                f"{self.base_url}/lessons?order=usage_count.asc&limit={limit}",
+            response = self.session.get(
+                f"{self.base_url}/lessons?select={self.LESSON_COLUMNS}&order=usage_count.asc&limit={limit}",
                 headers=self.headers,
                 timeout=10
             )
@@ -337,14 +607,24 @@ class SupabaseManager:
             return []
     
     def search_lessons(self, query: str) -> List[Lesson]:
-        """Search lessons by title or content."""
+        """Search lessons by title or content.
+        
+        Uses the search_tsv full-text column from schema.sql, which is backed by a
+        GIN index. Projects whose schema predates the column fall back to an
+        ILIKE scan.
+        """
         try:
-            response = requests.get(
-                f"{self.base_url}/lessons?or=(title.ilike.*{query}*,content.ilike.*{query}*)",
+            response = self.session.get(
+                f"{self.base_url}/lessons",
+                params={'select': self.LESSON_COLUMNS, 'search_tsv': f"wfts(english).{query}"},
                 headers=self.headers,
                 timeout=10
             )
             
+            if response.status_code == 400:
+                logger.warning("search_tsv is missing; re-run src/sql/schema.sql in Supabase")
+                return self._search_lessons_fallback(query)
+            
             if response.status_code == 200:
                 data = response.json()
                 return [self._row_to_lesson(row) for row in data]
@@ -355,33 +635,85 @@ class SupabaseManager:
             logger.error(f"Failed to search lessons with query '{query}': {e}")
             return []
     
-    def get_lesson_statistics(self) -> Dict[str, Any]:
-        """Get lesson statistics."""
+    def _search_lessons_fallback(self, query: str) -> List[Lesson]:
+        """Search lessons with a case-insensitive substring match on every row."""
+        # Double-quoted values may contain PostgREST's reserved , . ( ) characters
+        pattern = '"*' + query.replace('\\', '\\\\').replace('"', '\\"') + '*"'
+        response = self.session.get(
+            f"{self.base_url}/lessons",
+            params={'select': self.LESSON_COLUMNS, 'or': f"(title.ilike.{pattern},content.ilike.{pattern})"},
+            headers=self.headers,
+            timeout=10
+        )
+        
+        if response.status_code != 200:
+            return []
+        
+        return [self._row_to_lesson(row) for row in response.json()]
+    
+    def get_lesson_count(self) -> int:
+        """Get the number of lessons from a HEAD request's Content-Range header.
+        
+        With Prefer: count=exact PostgREST reports the total as "*/N" (or
+        "0-0/N") and sends no rows.
+        """
         try:
-            response = requests.get(
-                f"{self.base_url}/lessons?select=category,difficulty",
+            response = self.session.head(
+                f"{self.base_url}/lessons?select=id",
+                headers={**self.headers, 'Prefer': 'count=exact'},
+                timeout=10
+            )
+            
+            content_range = response.headers.get('Content-Range', '')
+            if response.status_code in [200, 206] and '/' in content_range:
+                return int(content_range.rsplit('/', 1)[1])
+            
+            logger.error(f"Failed to count lessons: {response.status_code}")
+            return 0
+            
+        except Exception as e:
+            logger.error(f"Failed to count lessons: {e}")
+            return 0
+    
+    def get_lesson_statistics(self, total_only: bool = False) -> Dict[str, Any]:
+        """Get lesson statistics.
+        
+        Uses the get_lesson_stats function from schema.sql, which returns
+        per-category and per-difficulty counts grouped in the database. Projects
+        whose schema predates the function fall back to counting rows here.
+        
+        Args:
+            total_only: Only fill in total_lessons, from a row-less count request
+        """
+        if total_only:
+            return {
+                'total_lessons': self.get_lesson_count(),
+                'categories': {},
+                'difficulties': {},
+                'last_updated': datetime.utcnow().isoformat()
+            }
+        
+        try:
+            response = self.session.post(
+                f"{self.base_url}/rpc/get_lesson_stats",
                 headers=self.headers,
+                data=b'{}',
                 timeout=10
             )
             
+            if response.status_code == 404:
+                logger.warning("get_lesson_stats is missing; re-run src/sql/schema.sql in Supabase")
+                return self._get_lesson_statistics_fallback()
+            
             if response.status_code == 200:
-                data = response.json()
-                total_count = len(data)
-                
-                # Calculate category distribution
-                categories = {}
-                difficulties = {}
-                for row in data:
-                    cat = row['category']
-                    categories[cat] = categories.get(cat, 0) + 1
-                    
-                    diff = row['difficulty']
-                    difficulties[diff] = difficulties.get(diff, 0) + 1
+                grouped = {'category': {}, 'difficulty': {}}
+                for row in response.json():
+                    grouped[row['dimension']][row['key']] = row['lesson_count']
                 
                 return {
-                    'total_lessons': total_count,
-                    'categories': categories,
-                    'difficulties': difficulties,
+                    'total_lessons': sum(grouped['category'].values()),
+                    'categories': grouped['category'],
+                    'difficulties': grouped['difficulty'],
                     'last_updated': datetime.utcnow().isoformat()
                 }
             
@@ -401,10 +733,35 @@ class SupabaseManager:
                 'error': str(e)
             }
     
+    def _get_lesson_statistics_fallback(self) -> Dict[str, Any]:
+        """Get lesson statistics by fetching every row's category and difficulty."""
+        response = self.session.get(
+            f"{self.base_url}/lessons?select=category,difficulty",
+            headers=self.headers,
+            timeout=10
+        )
+        
+        if response.status_code != 200:
+            return {
+                'total_lessons': 0,
+                'categories': {},
+                'difficulties': {},
+                'error': 'Failed to fetch data'
+            }
+        
+        data = response.json()
+        return {
+            'total_lessons': len(data),
+            'categories': dict(Counter(row['category'] for row in data)),
+            'difficulties': dict(Counter(row['difficulty'] for row in data)),
+            'last_updated': datetime.utcnow().isoformat()
+        }
+    
+    @_invalidates_reads
     def delete_lesson(self, lesson_id: int) -> bool:
         """Delete a lesson (use with caution)."""
         try:
-            response = requests.delete(
+            response = self.session.delete(
                 f"{self.base_url}/lessons?id=eq.{lesson_id}",
                 headers=self.headers,
                 timeout=10
@@ -416,6 +773,7 @@ class SupabaseManager:
             logger.error(f"Failed to delete lesson {lesson_id}: {e}")
             return False
     
+    @_invalidates_reads
     def update_lesson(self, lesson: Lesson) -> bool:
         """Update an existing lesson."""
         try:
@@ -432,10 +790,10 @@ class SupabaseManager:
                 'source': getattr(lesson, 'source', None)
             }
             
-            response = requests.patch(
+            response = self.session.patch(
                 f"{self.base_url}/lessons?id=eq.{lesson.id}",
                 headers=self.headers,
-                json=lesson_data,
+                data=dumps_bytes(lesson_data),
                 timeout=10
             )
             
@@ -446,6 +804,19 @@ class SupabaseManager:
             return False
 
 
+# Schema helpers
+@cache
+def create_supabase_tables_sql() -> str:
+    """Return the SQL that creates the Supabase tables and indexes."""
+    return files('src.sql').joinpath('schema.sql').read_text(encoding='utf-8')
+
+
+@cache
+def create_supabase_policies_sql() -> str:
+    """Return the SQL that enables row level security and the bot's access policies."""
+    return files('src.sql').joinpath('policies.sql').read_text(encoding='utf-8')
+
+
 # Convenience function
 def create_supabase_manager(url: Optional[str] = None, key: Optional[str] = None) -> SupabaseManager:
     """Create and return a Supabase manager instance."""
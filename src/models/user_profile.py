@@ -1,12 +1,14 @@
 """User profile model for interactive Telegram bot."""
 
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import List, Optional, Dict, Any
-import json
+from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Any, Set
 
+from ..utils import json_utils
+from ..utils.datetime_utils import parse_datetime
 
-@dataclass
+
+@dataclass(slots=True)
 class UserProfile:
     """User profile for tracking learning progress and preferences."""
     
@@ -22,41 +24,50 @@ class UserProfile:
     current_streak: int = 0
     longest_streak: int = 0
     preferred_difficulty: Optional[str] = None
-    preferred_topics: List[str] = field(default_factory=list)
+    preferred_topics: Set[str] = field(default_factory=set)
     is_active: bool = True
     
     def __post_init__(self):
         """Initialize default values after creation."""
-        if self.registration_date is None:
-            self.registration_date = datetime.utcnow()
-        if self.last_activity is None:
-            self.last_activity = datetime.utcnow()
+        if not isinstance(self.preferred_topics, set):
+            self.preferred_topics = set(self.preferred_topics)
+        if self.registration_date is None or self.last_activity is None:
+            now = datetime.utcnow()
+            if self.registration_date is None:
+                self.registration_date = now
+            if self.last_activity is None:
+                self.last_activity = now
     
-    def update_activity(self) -> None:
-        """Update last activity timestamp."""
-        self.last_activity = datetime.utcnow()
+    def update_activity(self, now: Optional[datetime] = None) -> None:
+        """Update last activity timestamp.
+        
+        Args:
+            now: Current time, when the caller already has it; defaults to utcnow()
+        """
+        self.last_activity = now or datetime.utcnow()
     
-    def add_lesson_completion(self) -> None:
-        """Record a lesson completion."""
+    def add_lesson_completion(self, now: Optional[datetime] = None) -> None:
+        """Record a lesson completion.
+        
+        Args:
+            now: Current time, when the caller already has it; defaults to utcnow()
+        """
         self.total_lessons_completed += 1
-        self.update_activity()
+        self.update_activity(now)
     
-    def add_quiz_attempt(self, score: float) -> None:
+    def add_quiz_attempt(self, score: float, now: Optional[datetime] = None) -> None:
         """Record a quiz attempt and update average score.
         
         Args:
             score: Quiz score as a percentage (0.0 to 100.0)
+            now: Current time, when the caller already has it; defaults to utcnow()
         """
         self.total_quizzes_taken += 1
         
-        # Calculate new average score
-        if self.total_quizzes_taken == 1:
-            self.average_quiz_score = score
-        else:
-            total_score = self.average_quiz_score * (self.total_quizzes_taken - 1) + score
-            self.average_quiz_score = total_score / self.total_quizzes_taken
+        # Incremental mean; the first attempt gives 0.0 + (score - 0.0) / 1 = score
+        self.average_quiz_score += (score - self.average_quiz_score) / self.total_quizzes_taken
         
-        self.update_activity()
+        self.update_activity(now)
     
     def update_streak(self, increment: bool = True) -> None:
         """Update learning streak.
@@ -72,22 +83,20 @@ class UserProfile:
             self.current_streak = 0
     
     def add_preferred_topic(self, topic: str) -> None:
-        """Add a topic to preferred topics list.
+        """Add a topic to preferred topics.
         
         Args:
             topic: Topic to add to preferences
         """
-        if topic not in self.preferred_topics:
-            self.preferred_topics.append(topic)
+        self.preferred_topics.add(topic)
     
     def remove_preferred_topic(self, topic: str) -> None:
-        """Remove a topic from preferred topics list.
+        """Remove a topic from preferred topics.
         
         Args:
             topic: Topic to remove from preferences
         """
-        if topic in self.preferred_topics:
-            self.preferred_topics.remove(topic)
+        self.preferred_topics.discard(topic)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert user profile to dictionary for database storage.
@@ -108,7 +117,7 @@ class UserProfile:
             'current_streak': self.current_streak,
             'longest_streak': self.longest_streak,
             'preferred_difficulty': self.preferred_difficulty,
-            'preferred_topics': json.dumps(self.preferred_topics),
+            'preferred_topics': json_utils.dumps(sorted(self.preferred_topics)),
             'is_active': self.is_active
         }
     
@@ -122,30 +131,21 @@ class UserProfile:
         Returns:
             UserProfile instance
         """
-        # Parse datetime fields
-        registration_date = None
-        if data.get('registration_date'):
-            registration_date = datetime.fromisoformat(data['registration_date'])
-        
-        last_activity = None
-        if data.get('last_activity'):
-            last_activity = datetime.fromisoformat(data['last_activity'])
-        
         # Parse preferred topics JSON
-        preferred_topics = []
+        preferred_topics = set()
         if data.get('preferred_topics'):
             try:
-                preferred_topics = json.loads(data['preferred_topics'])
-            except (json.JSONDecodeError, TypeError):
-                preferred_topics = []
+                preferred_topics = set(json_utils.loads(data['preferred_topics']))
+            except (ValueError, TypeError):
+                preferred_topics = set()
         
         return cls(
             user_id=data['user_id'],
             username=data.get('username'),
             first_name=data.get('first_name'),
             chat_id=data.get('chat_id'),
-            registration_date=registration_date,
-            last_activity=last_activity,
+            registration_date=parse_datetime(data.get('registration_date')),
+            last_activity=parse_datetime(data.get('last_activity')),
             total_lessons_completed=data.get('total_lessons_completed', 0),
             total_quizzes_taken=data.get('total_quizzes_taken', 0),
             average_quiz_score=data.get('average_quiz_score', 0.0),
@@ -169,12 +169,12 @@ class UserProfile:
             'current_streak': self.current_streak,
             'longest_streak': self.longest_streak,
             'days_active': (datetime.utcnow() - self.registration_date).days if self.registration_date else 0,
-            'preferred_topics': self.preferred_topics[:5],  # Limit to top 5
+            'preferred_topics': sorted(self.preferred_topics)[:5],  # Limit to 5
             'is_active': self.is_active
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProgress:
     """Individual user progress entry for tracking learning activities."""
     
@@ -223,17 +223,13 @@ class UserProgress:
         Returns:
             UserProgress instance
         """
-        completion_timestamp = None
-        if data.get('completion_timestamp'):
-            completion_timestamp = datetime.fromisoformat(data['completion_timestamp'])
-        
         return cls(
             id=data.get('id'),
             user_id=data['user_id'],
             activity_type=data.get('activity_type', ''),
             content_id=data.get('content_id', 0),
             content_title=data.get('content_title', ''),
-            completion_timestamp=completion_timestamp,
+            completion_timestamp=parse_datetime(data.get('completion_timestamp')),
             score=data.get('score'),
             time_spent=data.get('time_spent'),
             difficulty_level=data.get('difficulty_level', ''),
@@ -241,7 +237,7 @@ class UserProgress:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class QuizAttempt:
     """Quiz attempt record for detailed quiz tracking."""
     
@@ -258,6 +254,9 @@ class QuizAttempt:
     completed_at: Optional[datetime] = None
     answers: List[Dict[str, Any]] = field(default_factory=list)
     
+    # Set by add_answer until finalize() brings total_questions and score up to date
+    _score_stale: bool = field(default=False, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Initialize default values after creation."""
         if self.completed_at is None:
@@ -273,7 +272,8 @@ class QuizAttempt:
             return 0.0
         return (self.correct_answers / self.total_questions) * 100.0
     
-    def add_answer(self, question_id: int, user_answer: str, correct_answer: str, is_correct: bool) -> None:
+    def add_answer(self, question_id: int, user_answer: str, correct_answer: str, is_correct: bool,
+                   now: Optional[datetime] = None) -> None:
         """Add an answer to the quiz attempt.
         
         Args:
@@ -281,25 +281,42 @@ class QuizAttempt:
             user_answer: User's selected answer
             correct_answer: The correct answer
             is_correct: Whether the user's answer was correct
+            now: Answer time, when the caller already has it; defaults to utcnow()
         """
         answer_data = {
             'question_id': question_id,
             'user_answer': user_answer,
             'correct_answer': correct_answer,
             'is_correct': is_correct,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': (now or datetime.utcnow()).isoformat()
         }
         self.answers.append(answer_data)
         
         if is_correct:
             self.correct_answers += 1
         
+        self._score_stale = True
+    
+    def finalize(self) -> None:
+        """Update total_questions and score from the answers added with add_answer.
+        
+        Call once when the attempt is complete; score and total_questions are
+        not updated by add_answer itself. UserRepository.record_quiz_attempt
+        calls it before storing an attempt. Does nothing if no answer was added
+        since the last call, so attempts built with an explicit score keep it.
+        """
+        if not self._score_stale:
+            return
         self.total_questions = len(self.answers)
         self.score = self.calculate_score()
+        self._score_stale = False
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert quiz attempt to dictionary for database storage.
         
+        Serializes score and total_questions as they are; call finalize()
+        first if answers were added.
+        
         Returns:
             Dictionary representation of quiz attempt
         """
@@ -315,7 +332,7 @@ class QuizAttempt:
             'time_taken': self.time_taken,
             'is_practice_mode': self.is_practice_mode,
             'completed_at': self.completed_at.isoformat() if self.completed_at else None,
-            'answers': json.dumps(self.answers)
+            'answers': json_utils.dumps(self.answers)
         }
     
     @classmethod
@@ -328,15 +345,11 @@ class QuizAttempt:
         Returns:
             QuizAttempt instance
         """
-        completed_at = None
-        if data.get('completed_at'):
-            completed_at = datetime.fromisoformat(data['completed_at'])
-        
         answers = []
         if data.get('answers'):
             try:
-                answers = json.loads(data['answers'])
-            except (json.JSONDecodeError, TypeError):
+                answers = json_utils.loads(data['answers'])
+            except (ValueError, TypeError):
                 answers = []
         
         return cls(
@@ -350,12 +363,12 @@ class QuizAttempt:
             correct_answers=data.get('correct_answers', 0),
             time_taken=data.get('time_taken', 0),
             is_practice_mode=data.get('is_practice_mode', False),
-            completed_at=completed_at,
+            completed_at=parse_datetime(data.get('completed_at')),
             answers=answers
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class UserSession:
     """User session for managing multi-step interactions."""
     
@@ -376,35 +389,39 @@ class UserSession:
             self.last_updated = now
         if self.expires_at is None:
             # Default session timeout: 30 minutes
-            from datetime import timedelta
             self.expires_at = now + timedelta(minutes=30)
     
-    def update_session(self, data: Dict[str, Any]) -> None:
+    def update_session(self, data: Dict[str, Any], now: Optional[datetime] = None) -> None:
         """Update session data and timestamp.
         
         Args:
             data: New data to merge into session
+            now: Current time, when the caller already has it; defaults to utcnow()
         """
         self.session_data.update(data)
-        self.last_updated = datetime.utcnow()
+        self.last_updated = now or datetime.utcnow()
     
-    def is_expired(self) -> bool:
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
         """Check if session has expired.
         
+        Args:
+            now: Current time, when the caller already has it; defaults to utcnow()
+        
         Returns:
             True if session is expired, False otherwise
         """
-        return datetime.utcnow() > self.expires_at
+        return (now or datetime.utcnow()) > self.expires_at
     
-    def extend_session(self, minutes: int = 30) -> None:
+    def extend_session(self, minutes: int = 30, now: Optional[datetime] = None) -> None:
         """Extend session expiration time.
         
         Args:
             minutes: Minutes to extend the session
+            now: Current time, when the caller already has it; defaults to utcnow()
         """
-        from datetime import timedelta
-        self.expires_at = datetime.utcnow() + timedelta(minutes=minutes)
-        self.last_updated = datetime.utcnow()
+        now = now or datetime.utcnow()
+        self.expires_at = now + timedelta(minutes=minutes)
+        self.last_updated = now
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert session to dictionary for storage.
@@ -415,7 +432,7 @@ class UserSession:
         return {
             'user_id': self.user_id,
             'session_type': self.session_type,
-            'session_data': json.dumps(self.session_data),
+            'session_data': json_utils.dumps(self.session_data),
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'last_updated': self.last_updated.isoformat() if self.last_updated else None,
             'expires_at': self.expires_at.isoformat() if self.expires_at else None,
@@ -432,31 +449,19 @@ class UserSession:
         Returns:
             UserSession instance
         """
-        created_at = None
-        if data.get('created_at'):
-            created_at = datetime.fromisoformat(data['created_at'])
-        
-        last_updated = None
-        if data.get('last_updated'):
-            last_updated = datetime.fromisoformat(data['last_updated'])
-        
-        expires_at = None
-        if data.get('expires_at'):
-            expires_at = datetime.fromisoformat(data['expires_at'])
-        
         session_data = {}
         if data.get('session_data'):
             try:
-                session_data = json.loads(data['session_data'])
-            except (json.JSONDecodeError, TypeError):
+                session_data = json_utils.loads(data['session_data'])
+            except (ValueError, TypeError):
                 session_data = {}
         
         return cls(
             user_id=data['user_id'],
             session_type=data.get('session_type', ''),
             session_data=session_data,
-            created_at=created_at,
-            last_updated=last_updated,
-            expires_at=expires_at,
+            created_at=parse_datetime(data.get('created_at')),
+            last_updated=parse_datetime(data.get('last_updated')),
+            expires_at=parse_datetime(data.get('expires_at')),
             is_active=data.get('is_active', True)
         )
\ No newline at end of file
@@ -11,6 +11,7 @@ from telegram import Bot, Update
 from telegram.ext import Application, CommandHandler as TelegramCommandHandler, CallbackQueryHandler, MessageHandler, filters, ContextTypes
 from telegram.error import TelegramError, RetryAfter, TimedOut, NetworkError, BadRequest, Forbidden
 from telegram.constants import ParseMode
+from telegram.request import HTTPXRequest
 
 from src.config import get_config
 from src.models.lesson import Lesson
@@ -20,6 +21,16 @@ from .resilience_service import get_resilience_service, ErrorSeverity
 
 logger = logging.getLogger(__name__)
 
+# Lesson formatting patterns, compiled once at import time
+_BOLD_PATTERN = re.compile(r'\*\*(.*?)\*\*')
+_ITALIC_PATTERN = re.compile(r'(?<!\*)\*([^*]+?)\*(?!\*)')
+_EXCESS_NEWLINES_PATTERN = re.compile(r'\n{3,}')
+_FORMAT_TAG_PATTERN = re.compile(r'<(/?)([bi])>')
+
+# Lesson message footer templates
+_TAGS_FOOTER_TEMPLATE = "\n\n🏷️ {tags}"
+_LESSON_ID_FOOTER_TEMPLATE = "\n\n<i>Lesson #{lesson_id}</i>"
+
 
 class BotController:
     """Manages Telegram API communication and message formatting."""
@@ -36,8 +47,11 @@ class BotController:
         self.retry_attempts = config.retry_attempts
         self.retry_delay = config.retry_delay
         
-        # Initialize bot instance and application
-        self.bot = Bot(token=self.bot_token)
+        # Initialize bot instance with a pooled HTTP transport; the application reuses it
+        self.bot = Bot(
+            token=self.bot_token,
+            request=HTTPXRequest(connection_pool_size=8, connect_timeout=5.0, read_timeout=20.0)
+        )
         self.application = None
         self._validated = False
         
@@ -117,10 +131,10 @@ class BotController:
         footer_parts = []
         if lesson.tags:
             tags_str = " ".join([f"#{tag}" for tag in lesson.tags[:3]])  # Limit to 3 tags
-            footer_parts.append(f"\n\n🏷️ {tags_str}")
+            footer_parts.append(_TAGS_FOOTER_TEMPLATE.format(tags=tags_str))
         
         # Add lesson ID for tracking (hidden in small text)
-        footer_parts.append(f"\n\n<i>Lesson #{lesson.id}</i>")
+        footer_parts.append(_LESSON_ID_FOOTER_TEMPLATE.format(lesson_id=lesson.id))
         
         message += "".join(footer_parts)
         
@@ -139,10 +153,10 @@ class BotController:
         text = content
         
         # Convert **bold** to <b>bold</b>
-        text = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', text)
+        text = _BOLD_PATTERN.sub(r'<b>\1</b>', text)
         
         # Convert *italic* to <i>italic</i> (but not if it's part of **)
-        text = re.sub(r'(?<!\*)\*([^*]+?)\*(?!\*)', r'<i>\1</i>', text)
+        text = _ITALIC_PATTERN.sub(r'<i>\1</i>', text)
         
         # Escape HTML characters that aren't our tags
         text = self._escape_html_selective(text)
@@ -160,7 +174,7 @@ class BotController:
         text = '\n'.join(cleaned_lines)
         
         # Remove excessive empty lines (more than 2 consecutive)
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = _EXCESS_NEWLINES_PATTERN.sub('\n\n', text)
         
         return text.strip()
     
@@ -175,7 +189,6 @@ class BotController:
         """
         # First, protect our HTML tags
         protected_tags = []
-        tag_pattern = r'<(/?)([bi])>'
         
         def protect_tag(match):
             tag = match.group(0)
@@ -183,7 +196,7 @@ class BotController:
             protected_tags.append(tag)
             return placeholder
         
-        text = re.sub(tag_pattern, protect_tag, text)
+        text = _FORMAT_TAG_PATTERN.sub(protect_tag, text)
         
         # Now escape HTML characters
         text = self._escape_html(text)
@@ -650,7 +663,7 @@ class BotController:
             logger.error(f"Error closing application: {e}")
         
         try:
-            await self.bot.close()
+            await self.bot.shutdown()
             logger.info("Bot controller closed successfully")
         except Exception as e:
             logger.error(f"Error closing bot controller: {e}")
@@ -663,8 +676,8 @@ class BotController:
                 from telegram.ext import Application, ApplicationBuilder
                 from telegram import Bot
                 
-                # Try the standard approach first
-                self.application = Application.builder().token(self.bot_token).build()
+                # Try the standard approach first, sharing the controller's bot and connection pool
+                self.application = Application.builder().bot(self.bot).build()
                 logger.info("Successfully created application with standard approach")
                 
             except AttributeError as e:
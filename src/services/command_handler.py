@@ -1,7 +1,7 @@
 """Command handler for interactive Telegram bot commands."""
 
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, Iterable
 from datetime import datetime
 import asyncio
 import time
@@ -26,13 +26,15 @@ logger = logging.getLogger(__name__)
 class CommandHandler:
     """Handles interactive bot commands for users and admins."""
     
-    def __init__(self, lesson_manager: LessonManager, scheduler_service: SchedulerService, admin_user_ids: List[int] = None):
+    def __init__(self, lesson_manager: LessonManager, scheduler_service: SchedulerService,
+                 admin_user_ids: Optional[Iterable[int]] = None):
         """Initialize command handler.
         
         Args:
             lesson_manager: Lesson management service
             scheduler_service: Scheduler service for manual triggers
-            admin_user_ids: List of Telegram user IDs with admin privileges
+            admin_user_ids: Telegram user IDs with admin privileges; defaults to
+                config.admin_user_ids
         """
         from ..config import get_config
         config = get_config()
@@ -40,7 +42,7 @@ class CommandHandler:
         self.lesson_manager = lesson_manager
         self.scheduler_service = scheduler_service
         self.quiz_generator = QuizGenerator()
-        self.admin_user_ids = admin_user_ids or config.admin_user_ids
+        self.admin_user_ids = frozenset(admin_user_ids) if admin_user_ids else config.admin_user_ids
         
         # Initialize content browser
         self.content_browser = create_content_browser(lesson_manager)
@@ -1003,7 +1005,7 @@ Current Configuration:
         
         # Get current settings
         try:
-            config = get_config()
+            config = self.get_config()
             settings_text += f"""
 📅 **Posting Time:** {config.posting_time} {config.timezone}
 🧠 **Quizzes:** {'✅ Enabled' if config.enable_quizzes else '❌ Disabled'}
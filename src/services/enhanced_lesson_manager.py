@@ -25,6 +25,7 @@ class EnhancedLessonManager(LessonManager):
             # If a repository is provided, create a custom initialization
             self.repository = lesson_repository
             self.selector = LessonSelector(lesson_repository, cycle_days=30)
+            self._next_lesson_cache = {}
         else:
             # Use default initialization from parent
             super().__init__(db_path)
@@ -80,6 +81,7 @@ class EnhancedLessonManager(LessonManager):
             # Update lesson usage
             if hasattr(self, 'repository') and hasattr(self.repository, 'update_lesson_usage'):
                 self.repository.update_lesson_usage(lesson.id)
+                self._invalidate_next_lesson_cache()
             else:
                 logger.warning("Could not update lesson usage - method not available")
             
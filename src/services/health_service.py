@@ -3,18 +3,40 @@ Health check service for deployment platforms.
 Provides HTTP endpoint for health monitoring.
 """
 
+import atexit
 import sqlite3
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from typing import Dict, Any
 import json
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
 
+def _create_http_session() -> requests.Session:
+    """Create a pooled HTTP session with retries for Supabase health probes."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Shared session so repeated health probes reuse keep-alive connections
+_http_session = _create_http_session()
+atexit.register(_http_session.close)
+
+
 class HealthCheckHandler(BaseHTTPRequestHandler):
     """HTTP handler for health check requests."""
     
@@ -86,7 +108,6 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
         try:
             # Simple approach - try Supabase first, fallback to SQLite
             import os
-            import requests
             
             # Check if we have Supabase configuration
             supabase_url = os.getenv('SUPABASE_URL')
@@ -101,22 +122,24 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
                     'Content-Type': 'application/json'
                 }
                 
-                response = requests.get(
-                    f"{supabase_url}/rest/v1/lessons?select=id&limit=1",
-                    headers=headers,
-                    timeout=10
-                )
+                # Connection probe and lesson count are independent, so issue both at once.
+                # The count is a HEAD with Prefer: count=exact, so PostgREST reports the
+                # total in Content-Range ("*/N") instead of sending every lesson id
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    probe = executor.submit(
+                        _http_session.get, f"{supabase_url}/rest/v1/lessons?select=id&limit=1",
+                        headers=headers, timeout=10
+                    )
+                    count = executor.submit(
+                        _http_session.head, f"{supabase_url}/rest/v1/lessons?select=id",
+                        headers={**headers, 'Prefer': 'count=exact'}, timeout=10
+                    )
+                    response, count_response = probe.result(), count.result()
                 
                 if response.status_code == 200:
-                    # Get lesson count
-                    count_response = requests.get(
-                        f"{supabase_url}/rest/v1/lessons?select=id",
-                        headers=headers,
-                        timeout=10
-                    )
-                    
-                    if count_response.status_code == 200:
-                        lesson_count = len(count_response.json())
+                    total = count_response.headers.get('Content-Range', '').rpartition('/')[2]
+                    if count_response.status_code in [200, 206] and total.isdigit():
+                        lesson_count = int(total)
                     else:
                         lesson_count = 0
                     
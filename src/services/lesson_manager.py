@@ -1,7 +1,8 @@
 """Lesson management service that combines repository and selection functionality."""
 
 import logging
-from typing import Optional, List, Dict, Any
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
 
 from ..models.lesson import Lesson
@@ -26,10 +27,18 @@ class LessonManager:
         # Use database factory to create appropriate repository
         self.repository = create_lesson_repository()
         self.selector = LessonSelector(self.repository, cycle_days)
+        
+        # Next-lesson selection memoized per UTC day; cleared on any lesson write
+        self._next_lesson_cache: Dict[Tuple[str, SelectionStrategy, Optional[str]], Lesson] = {}
+    
+    def _invalidate_next_lesson_cache(self) -> None:
+        """Drop memoized next-lesson selections after lessons change."""
+        self._next_lesson_cache.clear()
     
     # Repository operations
     def add_lesson(self, lesson: Lesson) -> Optional[int]:
         """Add a new lesson to the system."""
+        self._invalidate_next_lesson_cache()
         return self.repository.create_lesson(lesson)
     
     def get_lesson(self, lesson_id: int) -> Optional[Lesson]:
@@ -38,10 +47,12 @@ class LessonManager:
     
     def update_lesson(self, lesson: Lesson) -> bool:
         """Update an existing lesson."""
+        self._invalidate_next_lesson_cache()
         return self.repository.update_lesson(lesson)
     
     def delete_lesson(self, lesson_id: int) -> bool:
         """Delete a lesson by ID."""
+        self._invalidate_next_lesson_cache()
         return self.repository.delete_lesson(lesson_id)
     
     def get_lessons_by_category(self, category: str) -> List[Lesson]:
@@ -65,14 +76,25 @@ class LessonManager:
         Returns:
             Next lesson to post or None if no lessons available
         """
-        return self.selector.get_next_lesson(strategy, category)
+        cache_key = (datetime.utcnow().date().isoformat(), strategy, category)
+        lesson = self._next_lesson_cache.get(cache_key)
+        if lesson is not None:
+            return lesson
+        
+        lesson = self.selector.get_next_lesson(strategy, category)
+        if lesson is not None:
+            # Only today's selection is worth keeping
+            self._next_lesson_cache = {cache_key: lesson}
+        return lesson
     
     def mark_lesson_posted(self, lesson_id: int) -> bool:
         """Mark a lesson as posted."""
+        self._invalidate_next_lesson_cache()
         return self.selector.mark_lesson_posted(lesson_id)
     
     def reset_usage_cycle(self) -> bool:
         """Reset usage cycle for all lessons."""
+        self._invalidate_next_lesson_cache()
         return self.selector.reset_usage_cycle()
     
     def is_cycle_reset_needed(self) -> bool:
@@ -82,10 +104,12 @@ class LessonManager:
     # Import operations
     def import_from_json(self, file_path: str) -> Dict[str, Any]:
         """Import lessons from JSON file."""
+        self._invalidate_next_lesson_cache()
         return self.repository.import_lessons_from_json(file_path)
     
     def import_from_csv(self, file_path: str) -> Dict[str, Any]:
         """Import lessons from CSV file."""
+        self._invalidate_next_lesson_cache()
         return self.repository.import_lessons_from_csv(file_path)
     
     def bulk_import(self, file_path: str) -> Dict[str, Any]:
@@ -3,12 +3,15 @@
 import json
 import csv
 import logging
+import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from pathlib import Path
 
-from ..models.lesson import Lesson
+from ..models.lesson import Lesson, LessonSimilarityIndex
 from ..models.database import DatabaseManager
+from ..utils import json_utils
 
 
 logger = logging.getLogger(__name__)
@@ -23,6 +26,29 @@ class LessonRepository:
         self.db_manager = DatabaseManager(db_path)
         if not self.db_manager.is_initialized():
             self.db_manager.initialize_database()
+        # Duplicate index for the connection of an open bulk_load_context()
+        self._bulk_index: Optional[Tuple[sqlite3.Connection, LessonSimilarityIndex]] = None
+    
+    _INSERT_LESSON_SQL = """
+        INSERT INTO lessons (
+            title, content, category, difficulty, created_at,
+            last_used, usage_count, tags, source
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    def _lesson_to_params(self, lesson: Lesson) -> tuple:
+        """Convert a lesson into INSERT parameters."""
+        return (
+            lesson.title,
+            lesson.content,
+            lesson.category,
+            lesson.difficulty,
+            lesson.created_at.isoformat() if lesson.created_at else datetime.utcnow().isoformat(),
+            lesson.last_used.isoformat() if lesson.last_used else None,
+            lesson.usage_count,
+            json_utils.dumps(lesson.tags),
+            lesson.source
+        )
     
     def create_lesson(self, lesson: Lesson) -> Optional[int]:
         """Create a new lesson in the database."""
@@ -38,22 +64,7 @@ class LessonRepository:
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute("""
-                    INSERT INTO lessons (
-                        title, content, category, difficulty, created_at,
-                        last_used, usage_count, tags, source
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    lesson.title,
-                    lesson.content,
-                    lesson.category,
-                    lesson.difficulty,
-                    lesson.created_at.isoformat() if lesson.created_at else datetime.utcnow().isoformat(),
-                    lesson.last_used.isoformat() if lesson.last_used else None,
-                    lesson.usage_count,
-                    json.dumps(lesson.tags),
-                    lesson.source
-                ))
+                cursor.execute(self._INSERT_LESSON_SQL, self._lesson_to_params(lesson))
                 
                 lesson_id = cursor.lastrowid
                 conn.commit()
@@ -65,6 +76,196 @@ class LessonRepository:
             logger.error(f"Failed to create lesson: {e}")
             return None
     
+    def create_lessons(self, lessons: List[Lesson], conn: Optional[sqlite3.Connection] = None) -> int:
+        """Create multiple lessons with one executemany in a single transaction.
+        
+        Invalid lessons and duplicates (of stored lessons or of earlier lessons
+        in the same batch) are skipped, as in create_lesson.
+        
+        Args:
+            lessons: Lessons to insert
+            conn: Optional open connection from bulk_load_context(); the batch then
+                joins that connection's transaction instead of committing its own
+        
+        Returns:
+            Number of lessons created
+        """
+        if not lessons:
+            return 0
+        
+        try:
+            return self._write_batch(self._insert_new_lessons, lessons, conn)
+        except Exception as e:
+            logger.error(f"Failed to create lessons: {e}")
+            return 0
+    
+    def bulk_insert_raw(self, rows: Iterable[Dict[str, Any]], conn: Optional[sqlite3.Connection] = None) -> int:
+        """Insert lesson dicts (e.g. streamed seed data) without building Lesson objects.
+        
+        Rows are checked with the same rules as Lesson.validate and
+        Lesson.is_similar_to; invalid rows and duplicates are skipped.
+        
+        Args:
+            rows: Lesson dicts with the keys accepted by Lesson.from_dict
+            conn: Optional open connection from bulk_load_context()
+        
+        Returns:
+            Number of lessons created
+        """
+        try:
+            return self._write_batch(self._insert_raw_rows, rows, conn)
+        except Exception as e:
+            logger.error(f"Failed to bulk insert lessons: {e}")
+            return 0
+    
+    def _write_batch(self, write: Callable[[sqlite3.Connection, Any], int], items: Any,
+                     conn: Optional[sqlite3.Connection] = None) -> int:
+        """Run a batch writer on its own transaction, or inside a savepoint on conn."""
+        if conn is not None:
+            # Undo only this batch on failure, leaving the outer transaction intact
+            conn.execute("SAVEPOINT lesson_batch")
+            try:
+                return write(conn, items)
+            except Exception:
+                conn.execute("ROLLBACK TO lesson_batch")
+                raise
+            finally:
+                conn.execute("RELEASE lesson_batch")
+        
+        with self.db_manager.get_connection() as conn:
+            created_count = write(conn, items)
+            conn.commit()
+            return created_count
+    
+    def _load_similarity_index(self, conn: sqlite3.Connection) -> LessonSimilarityIndex:
+        """Build a duplicate index of the lessons visible through conn."""
+        index = LessonSimilarityIndex()
+        for row in conn.execute("SELECT title, content FROM lessons"):
+            index.add(row['title'], row['content'])
+        return index
+    
+    def _known_lessons(self, conn: sqlite3.Connection) -> LessonSimilarityIndex:
+        """Return the duplicate index for conn.
+        
+        Inside bulk_load_context() the index built when the context opened is
+        reused, so each batch does not re-read the whole table; otherwise the
+        stored lessons are loaded once for this batch.
+        """
+        if self._bulk_index is not None and self._bulk_index[0] is conn:
+            return self._bulk_index[1]
+        return self._load_similarity_index(conn)
+    
+    def _insert_new_lessons(self, conn: sqlite3.Connection, lessons: List[Lesson]) -> int:
+        """Validate, de-duplicate and insert lessons on an open connection."""
+        known_lessons = self._known_lessons(conn)
+        # Lessons from this batch are only added to known_lessons once inserted,
+        # so a batch rolled back by _write_batch leaves the shared index untouched
+        batch_lessons = LessonSimilarityIndex()
+        accepted = []
+        
+        for lesson in lessons:
+            errors = lesson.validate_errors()
+            if errors:
+                logger.error(f"Failed to create lesson {lesson.title!r}: {errors[0]}")
+                continue
+            
+            if (known_lessons.is_similar(lesson.title, lesson.content)
+                    or batch_lessons.is_similar(lesson.title, lesson.content)):
+                logger.warning(f"Duplicate lesson detected: {lesson.title}")
+                continue
+            
+            accepted.append(lesson)
+            batch_lessons.add(lesson.title, lesson.content)
+        
+        if accepted:
+            conn.executemany(
+                self._INSERT_LESSON_SQL,
+                [self._lesson_to_params(lesson) for lesson in accepted]
+            )
+            for lesson in accepted:
+                known_lessons.add(lesson.title, lesson.content)
+        
+        logger.info(f"Created {len(accepted)}/{len(lessons)} lessons")
+        return len(accepted)
+    
+    def _insert_raw_rows(self, conn: sqlite3.Connection, rows: Iterable[Dict[str, Any]]) -> int:
+        """Validate, de-duplicate and insert lesson dicts on an open connection."""
+        known_texts = self._known_lessons(conn)
+        batch_texts = LessonSimilarityIndex()
+        now = datetime.utcnow().isoformat()
+        params = []
+        total = 0
+        
+        for data in rows:
+            total += 1
+            title = data.get('title', '')
+            content = data.get('content', '')
+            category = data.get('category', '')
+            difficulty = data.get('difficulty', '')
+            source = data.get('source', 'manual')
+            tags = data.get('tags', [])
+            usage_count = data.get('usage_count', 0)
+            
+            errors = Lesson.field_errors(title, content, category, difficulty, source, tags, usage_count)
+            if errors:
+                logger.error(f"Failed to create lesson {title!r}: {errors[0]}")
+                continue
+            
+            if known_texts.is_similar(title, content) or batch_texts.is_similar(title, content):
+                logger.warning(f"Duplicate lesson detected: {title}")
+                continue
+            
+            batch_texts.add(title, content)
+            params.append((
+                title, content, category, difficulty,
+                data.get('created_at') or now,
+                data.get('last_used'),
+                usage_count,
+                json_utils.dumps(tags),
+                source
+            ))
+        
+        if params:
+            conn.executemany(self._INSERT_LESSON_SQL, params)
+            for title, content, *_ in params:
+                known_texts.add(title, content)
+        
+        logger.info(f"Created {len(params)}/{total} lessons")
+        return len(params)
+    
+    @contextmanager
+    def bulk_load_context(self):
+        """Yield a connection tuned for bulk loading, inside one IMMEDIATE transaction.
+        
+        WAL journaling is persistent for the database file; the relaxed sync and
+        temp store settings stay on the connection, and the 64 MB cache only
+        lasts for the load. Stored lessons are indexed for duplicate checks once
+        here, and batches written on the yielded connection extend that index.
+        """
+        with self.db_manager.get_connection() as conn:
+            # The connection is reused afterwards, so restore what is changed here
+            isolation_level = conn.isolation_level
+            cache_size = conn.execute("PRAGMA cache_size").fetchone()[0]
+            conn.isolation_level = None  # Manage the transaction explicitly
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-65536")
+            
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                self._bulk_index = (conn, self._load_similarity_index(conn))
+                try:
+                    yield conn
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+                conn.execute("COMMIT")
+            finally:
+                self._bulk_index = None
+                conn.execute(f"PRAGMA cache_size={int(cache_size)}")
+                conn.isolation_level = isolation_level
+    
     def get_lesson_by_id(self, lesson_id: int) -> Optional[Lesson]:
         """Retrieve a lesson by its ID."""
         try:
@@ -140,7 +341,7 @@ class LessonRepository:
                     lesson.difficulty,
                     lesson.last_used.isoformat() if lesson.last_used else None,
                     lesson.usage_count,
-                    json.dumps(lesson.tags),
+                    json_utils.dumps(lesson.tags),
                     lesson.source,
                     lesson.id
                 ))
@@ -272,8 +473,7 @@ class LessonRepository:
             if not file_path_obj.exists():
                 raise FileNotFoundError(f"File not found: {file_path}")
             
-            with open(file_path_obj, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = json_utils.loads(file_path_obj.read_bytes())
             
             # Handle both single lesson and array of lessons
             if isinstance(data, dict):
@@ -399,7 +599,7 @@ class LessonRepository:
             category=row['category'],
             difficulty=row['difficulty'],
             usage_count=row['usage_count'],
-            tags=json.loads(row['tags']) if row['tags'] else [],
+            tags=json_utils.loads(row['tags']) if row['tags'] else [],
             source=row['source']
         )
         
@@ -28,6 +28,12 @@ class PostingHistoryRepository:
         self.logging_service = get_logging_service()
         self._ensure_tables()
     
+    _INSERT_HISTORY_SQL = """
+        INSERT INTO posting_history 
+        (lesson_id, posted_at, success, error_message, retry_count, message_id, correlation_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+    
     def _ensure_tables(self) -> None:
         """Ensure posting history tables exist."""
         try:
@@ -38,7 +44,7 @@ class PostingHistoryRepository:
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                         lesson_id INTEGER,
                         posted_at TIMESTAMP NOT NULL,
-                        success BOOLEAN NOT NULL,
+                        success INTEGER NOT NULL CHECK (success IN (0, 1)),
                         error_message TEXT,
                         retry_count INTEGER DEFAULT 0,
                         message_id INTEGER,
@@ -93,11 +99,7 @@ class PostingHistoryRepository:
             history.validate()
             
             with self.db_manager.get_connection() as conn:
-                cursor = conn.execute("""
-                    INSERT INTO posting_history 
-                    (lesson_id, posted_at, success, error_message, retry_count, message_id, correlation_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
+                cursor = conn.execute(self._INSERT_HISTORY_SQL, (
                     history.lesson_id,
                     history.posted_at,
                     history.success,
@@ -46,11 +46,13 @@ class ProgressTracker:
                 return False
             
             # Record progress entry
+            now = datetime.utcnow()
             progress = UserProgress(
                 user_id=user_id,
                 activity_type='lesson',
                 content_id=lesson_id,
                 content_title=lesson_title,
+                completion_timestamp=now,
                 difficulty_level=difficulty,
                 topic_category=category,
                 time_spent=time_spent
@@ -61,10 +63,10 @@ class ProgressTracker:
                 return False
             
             # Update user profile
-            profile.add_lesson_completion()
+            profile.add_lesson_completion(now)
             self._update_learning_streak(profile, 'lesson')
             
-            if category and category not in profile.preferred_topics:
+            if category:
                 profile.add_preferred_topic(category)
             
             if not self.user_repo.update_user_profile(profile):
@@ -109,6 +111,7 @@ class ProgressTracker:
             attempt_number = self.user_repo.get_next_attempt_number(user_id, quiz_id)
             
             # Record quiz attempt
+            now = datetime.utcnow()
             attempt = QuizAttempt(
                 user_id=user_id,
                 quiz_id=quiz_id,
@@ -119,6 +122,7 @@ class ProgressTracker:
                 correct_answers=correct_answers,
                 time_taken=time_taken,
                 is_practice_mode=is_practice,
+                completed_at=now,
                 answers=answers or []
             )
             
@@ -128,7 +132,7 @@ class ProgressTracker:
             
             # Update user profile (only for non-practice attempts)
             if not is_practice:
-                profile.add_quiz_attempt(score)
+                profile.add_quiz_attempt(score, now)
                 self._update_learning_streak(profile, 'quiz')
                 
                 if not self.user_repo.update_user_profile(profile):
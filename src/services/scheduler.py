@@ -2,16 +2,18 @@
 
 import asyncio
 import logging
-from datetime import datetime, time, timedelta
+from dataclasses import replace
+from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Dict, Any, Callable
-import pytz
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, EVENT_JOB_MISSED
 from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.executors.asyncio import AsyncIOExecutor
 
-from src.config import get_config
+from src.config import Config, get_config, set_config, parse_posting_time
 from src.models.lesson import Lesson
 from src.models.posting_history import PostingHistory
 from .lesson_manager import LessonManager
@@ -23,6 +25,12 @@ from .resilience_service import get_resilience_service, ErrorSeverity
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _get_timezone(name: str) -> ZoneInfo:
+    """Resolve a timezone by name, caching the result for reuse."""
+    return ZoneInfo(name)
+
+
 class SchedulerService:
     """Manages automated daily lesson posting with APScheduler."""
     
@@ -36,7 +44,6 @@ class SchedulerService:
         """
         self.lesson_manager = lesson_manager
         self.bot_controller = bot_controller
-        self.config = get_config()
         self.resilience_service = get_resilience_service()
         self.quiz_generator = QuizGenerator()
         
@@ -61,7 +68,7 @@ class SchedulerService:
             jobstores=jobstores,
             executors=executors,
             job_defaults=job_defaults,
-            timezone=pytz.timezone(self.config.timezone)
+            timezone=_get_timezone(self.config.timezone)
         )
         
         # Add event listeners
@@ -120,22 +127,20 @@ class SchedulerService:
         except Exception as e:
             logger.error(f"Error stopping scheduler: {e}")
     
+    @property
+    def config(self) -> Config:
+        """Current global configuration, including any rescheduled posting time."""
+        return get_config()
+    
     def _validate_config(self) -> None:
         """Validate scheduler configuration."""
         try:
-            # Validate posting time format
-            time_parts = self.config.posting_time.split(":")
-            if len(time_parts) != 2:
-                raise ValueError("Invalid posting time format")
-            
-            hour, minute = int(time_parts[0]), int(time_parts[1])
-            if not (0 <= hour <= 23) or not (0 <= minute <= 59):
-                raise ValueError("Invalid posting time values")
+            # Posting time is validated and parsed by Config itself
             
             # Validate timezone
             try:
-                pytz.timezone(self.config.timezone)
-            except pytz.exceptions.UnknownTimeZoneError:
+                _get_timezone(self.config.timezone)
+            except (ZoneInfoNotFoundError, ValueError):
                 raise ValueError(f"Unknown timezone: {self.config.timezone}")
             
         except Exception as e:
@@ -144,13 +149,10 @@ class SchedulerService:
     async def _schedule_daily_posting(self) -> None:
         """Schedule the daily lesson posting job."""
         try:
-            # Parse posting time
-            hour, minute = map(int, self.config.posting_time.split(":"))
-            
             # Create cron trigger for daily execution
             trigger = CronTrigger(
-                hour=hour,
-                minute=minute,
+                hour=self.config.posting_clock.hour,
+                minute=self.config.posting_clock.minute,
                 timezone=self.config.timezone
             )
             
@@ -163,7 +165,7 @@ class SchedulerService:
                 replace_existing=True
             )
             
-            logger.info(f"Daily posting job scheduled for {hour:02d}:{minute:02d} {self.config.timezone}")
+            logger.info(f"Daily posting job scheduled for {self.config.posting_clock:%H:%M} {self.config.timezone}")
             
         except Exception as e:
             logger.error(f"Failed to schedule daily posting: {e}")
@@ -222,7 +224,7 @@ class SchedulerService:
                     
                     # Schedule quiz if enabled
                     if self.enable_quizzes:
-                        quiz_run_time = datetime.now(pytz.timezone(self.config.timezone)) + timedelta(minutes=self.quiz_delay_minutes)
+                        quiz_run_time = datetime.now(_get_timezone(self.config.timezone)) + timedelta(minutes=self.quiz_delay_minutes)
                         logger.info(f"Scheduling quiz for lesson {lesson.id} in {self.quiz_delay_minutes} minutes")
                         logger.info(f"Quiz will run at: {quiz_run_time}")
                         
@@ -383,10 +385,8 @@ class SchedulerService:
                 
         except Exception as e:
             error_msg = f"Exception in quiz posting for lesson {lesson.id}: {e}"
-            logger.error(error_msg)
-            # Log full traceback for debugging
-            import traceback
-            logger.error(f"Quiz posting traceback: {traceback.format_exc()}")
+            # Log with the full traceback for debugging
+            logger.exception(error_msg)
             return {
                 'success': False,
                 'error': str(e),
@@ -417,10 +417,8 @@ class SchedulerService:
             result = asyncio.run(run_quiz_post())
             logger.info(f"Quiz sync wrapper completed for lesson {lesson.id}")
         except Exception as e:
-            logger.error(f"Error in quiz sync wrapper for lesson {lesson.id}: {e}")
-            # Log the full traceback for debugging
-            import traceback
-            logger.error(f"Quiz sync wrapper traceback: {traceback.format_exc()}")
+            # Log with the full traceback for debugging
+            logger.exception(f"Error in quiz sync wrapper for lesson {lesson.id}: {e}")
     
     async def _check_missed_posts(self) -> None:
         """Check for and handle missed posts on startup."""
@@ -428,7 +426,7 @@ class SchedulerService:
             # Get the last successful post time (this would need to be implemented in PostingHistory)
             # For now, we'll implement basic missed post detection
             
-            current_time = datetime.now(pytz.timezone(self.config.timezone))
+            current_time = datetime.now(_get_timezone(self.config.timezone))
             posting_time_today = self._get_posting_time_for_date(current_time.date())
             
             # If current time is past today's posting time, check if we posted today
@@ -455,10 +453,9 @@ class SchedulerService:
         Returns:
             Datetime object for posting time on that date
         """
-        hour, minute = map(int, self.config.posting_time.split(":"))
-        tz = pytz.timezone(self.config.timezone)
+        tz = _get_timezone(self.config.timezone)
         
-        return tz.localize(datetime.combine(date, time(hour, minute)))
+        return datetime.combine(date, self.config.posting_clock, tzinfo=tz)
     
     async def trigger_immediate_post(self) -> Dict[str, Any]:
         """
@@ -483,29 +480,22 @@ class SchedulerService:
         """
         try:
             # Validate new time format
-            time_parts = new_time.split(":")
-            if len(time_parts) != 2:
-                raise ValueError("Invalid time format")
-            
-            hour, minute = int(time_parts[0]), int(time_parts[1])
-            if not (0 <= hour <= 23) or not (0 <= minute <= 59):
-                raise ValueError("Invalid time values")
+            parse_posting_time(new_time)
             
             # Validate timezone if provided
             timezone = new_timezone or self.config.timezone
             try:
-                pytz.timezone(timezone)
-            except pytz.exceptions.UnknownTimeZoneError:
+                _get_timezone(timezone)
+            except (ZoneInfoNotFoundError, ValueError):
                 raise ValueError(f"Unknown timezone: {timezone}")
             
             # Remove existing job
             if self.scheduler.get_job(self._daily_job_id):
                 self.scheduler.remove_job(self._daily_job_id)
             
-            # Update config (this would need to be persisted in a real implementation)
-            self.config.posting_time = new_time
-            if new_timezone:
-                self.config.timezone = new_timezone
+            # Config is immutable; publish a rescheduled copy so every reader sees it
+            # (this would need to be persisted in a real implementation)
+            set_config(replace(self.config, posting_time=new_time, timezone=timezone))
             
             # Reschedule
             await self._schedule_daily_posting()
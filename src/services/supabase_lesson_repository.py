@@ -1,7 +1,7 @@
 """Supabase-based lesson repository for CRUD operations."""
 
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from datetime import datetime, timedelta
 
 from ..models.lesson import Lesson
@@ -26,22 +26,29 @@ class SupabaseLessonRepository:
         """Create a new lesson in Supabase."""
         return self.db_manager.create_lesson(lesson)
     
+    def create_lessons(self, lessons: List[Lesson]) -> int:
+        """Create multiple lessons in Supabase with a single bulk insert."""
+        return self.db_manager.create_lessons(lessons)
+    
     def get_lesson_by_id(self, lesson_id: int) -> Optional[Lesson]:
         """Get lesson by ID from Supabase."""
         return self.db_manager.get_lesson_by_id(lesson_id)
     
+    def get_lessons_by_ids(self, lesson_ids: List[int]) -> List[Lesson]:
+        """Get several lessons by ID from Supabase with batched requests."""
+        return self.db_manager.get_lessons_by_ids(lesson_ids)
+    
     def get_all_lessons(self) -> List[Lesson]:
         """Get all lessons from Supabase."""
         return self.db_manager.get_all_lessons()
     
+    def iter_all_lessons(self) -> Iterator[Lesson]:
+        """Yield all lessons from Supabase one page at a time."""
+        return self.db_manager.iter_all_lessons()
+    
     def get_lesson_count(self) -> int:
         """Get total count of lessons."""
-        try:
-            lessons = self.get_all_lessons()
-            return len(lessons)
-        except Exception as e:
-            logger.error(f"Failed to get lesson count: {e}")
-            return 0
+        return self.db_manager.get_lesson_count()
     
     def get_lessons_by_category(self, category: str) -> List[Lesson]:
         """Get lessons by category from Supabase."""
@@ -97,9 +104,9 @@ class SupabaseLessonRepository:
             logger.error(f"Failed to get lessons by tags {tags}: {e}")
             return []
     
-    def get_lesson_statistics(self) -> Dict[str, Any]:
-        """Get lesson statistics."""
-        return self.db_manager.get_lesson_statistics()
+    def get_lesson_statistics(self, total_only: bool = False) -> Dict[str, Any]:
+        """Get lesson statistics; total_only skips the per-category breakdown."""
+        return self.db_manager.get_lesson_statistics(total_only)
     
     def delete_lesson(self, lesson_id: int) -> bool:
         """Delete a lesson (use with caution)."""
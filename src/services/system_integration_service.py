@@ -196,8 +196,8 @@ class SystemIntegrationService:
                     
                     db_manager = DatabaseManager()
                     
-                    # Attempt to repair database
-                    await asyncio.to_thread(db_manager.check_integrity)
+                    # Verify the database file before reporting recovery
+                    await asyncio.to_thread(db_manager.verify_full)
                     
                     logger.info("Database recovery completed successfully")
                     return True
@@ -7,7 +7,7 @@ from typing import Dict, Any, Optional, List
 import json
 from pathlib import Path
 
-from src.config import get_config
+from src.config import Config, get_config
 from .logging_service import get_logging_service, LogLevel, LogCategory
 from .monitoring_service import get_monitoring_service, HealthStatus
 from .posting_history_repository import PostingHistoryRepository
@@ -21,7 +21,6 @@ class SystemStatusService:
     
     def __init__(self):
         """Initialize system status service."""
-        self.config = get_config()
         self.logging_service = get_logging_service()
         self.monitoring_service = get_monitoring_service()
         self.posting_history_repo = PostingHistoryRepository()
@@ -35,6 +34,11 @@ class SystemStatusService:
         self._cache_expiry = timedelta(minutes=5)
         self._last_cache_update = None
     
+    @property
+    def config(self) -> Config:
+        """Current global configuration, so reports reflect a rescheduled posting time."""
+        return get_config()
+    
     async def get_comprehensive_status(self, include_history: bool = True,
                                      include_metrics: bool = True) -> Dict[str, Any]:
         """
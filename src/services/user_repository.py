@@ -1,7 +1,7 @@
 """User repository for managing user profiles and progress data."""
 
 import logging
-import requests
+import threading
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
 
@@ -15,6 +15,11 @@ logger = logging.getLogger(__name__)
 class UserRepository:
     """Repository for user data operations using Supabase."""
     
+    # Command usage rows are buffered and inserted together once this many are
+    # queued, or by a background timer this many seconds after the first row
+    COMMAND_USAGE_BATCH_SIZE = 50
+    COMMAND_USAGE_FLUSH_SECONDS = 30.0
+    
     def __init__(self, supabase_manager):
         """Initialize user repository with Supabase manager.
         
@@ -24,6 +29,11 @@ class UserRepository:
         self.supabase = supabase_manager
         self.base_url = supabase_manager.base_url
         self.headers = supabase_manager.headers
+        self.session = supabase_manager.session
+        
+        self._usage_buffer: List[Dict[str, Any]] = []
+        self._usage_lock = threading.Lock()
+        self._usage_timer: Optional[threading.Timer] = None
     
     # User Profile Operations
     def create_user_profile(self, user_id: int, username: str = None, first_name: str = None, chat_id: int = None) -> Optional[UserProfile]:
@@ -46,7 +56,7 @@ class UserRepository:
                 chat_id=chat_id
             )
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/user_profiles",
                 headers=self.headers,
                 json=profile.to_dict(),
@@ -74,7 +84,7 @@ class UserRepository:
             UserProfile or None if not found
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/user_profiles?user_id=eq.{user_id}",
                 headers=self.headers,
                 timeout=10
@@ -105,7 +115,7 @@ class UserRepository:
             # Remove user_id from update data as it's the primary key
             update_data.pop('user_id', None)
             
-            response = requests.patch(
+            response = self.session.patch(
                 f"{self.base_url}/user_profiles?user_id=eq.{profile.user_id}",
                 headers=self.headers,
                 json=update_data,
@@ -156,7 +166,7 @@ class UserRepository:
             True if successful, False otherwise
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/user_progress",
                 headers=self.headers,
                 json=progress.to_dict(),
@@ -186,7 +196,7 @@ class UserRepository:
             List of UserProgress entries
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/user_progress?user_id=eq.{user_id}&order=completion_timestamp.desc&limit={limit}",
                 headers=self.headers,
                 timeout=10
@@ -206,14 +216,18 @@ class UserRepository:
     def record_quiz_attempt(self, attempt: QuizAttempt) -> bool:
         """Record quiz attempt.
         
+        Finalizes the attempt first, so answers added with add_answer are
+        reflected in its score and total_questions.
+        
         Args:
             attempt: QuizAttempt to record
             
         Returns:
             True if successful, False otherwise
         """
+        attempt.finalize()
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/quiz_attempts",
                 headers=self.headers,
                 json=attempt.to_dict(),
@@ -247,7 +261,7 @@ class UserRepository:
             if lesson_id:
                 url += f"&lesson_id=eq.{lesson_id}"
             
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, headers=self.headers, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -270,7 +284,7 @@ class UserRepository:
             Next attempt number
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/quiz_attempts?user_id=eq.{user_id}&quiz_id=eq.{quiz_id}&select=attempt_number&order=attempt_number.desc&limit=1",
                 headers=self.headers,
                 timeout=10
@@ -299,7 +313,7 @@ class UserRepository:
         """
         try:
             # Use upsert to handle both create and update
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/user_sessions",
                 headers={**self.headers, 'Prefer': 'resolution=merge-duplicates'},
                 json=session.to_dict(),
@@ -328,7 +342,7 @@ class UserRepository:
             UserSession or None if not found or expired
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/user_sessions?user_id=eq.{user_id}&is_active=eq.true",
                 headers=self.headers,
                 timeout=10
@@ -382,7 +396,7 @@ class UserRepository:
             True if successful, False otherwise
         """
         try:
-            response = requests.patch(
+            response = self.session.patch(
                 f"{self.base_url}/user_sessions?user_id=eq.{user_id}",
                 headers=self.headers,
                 json={'is_active': False},
@@ -403,7 +417,7 @@ class UserRepository:
         """
         try:
             now = datetime.utcnow().isoformat()
-            response = requests.patch(
+            response = self.session.patch(
                 f"{self.base_url}/user_sessions?expires_at=lt.{now}&is_active=eq.true",
                 headers=self.headers,
                 json={'is_active': False},
@@ -432,7 +446,7 @@ class UserRepository:
             True if successful, False otherwise
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/admin_action_logs",
                 headers=self.headers,
                 json=log_entry.to_dict(),
@@ -452,26 +466,73 @@ class UserRepository:
     def record_command_usage(self, stats: CommandUsageStats) -> bool:
         """Record command usage statistics.
         
+        Rows are queued and written by flush_command_usage() in one request
+        once COMMAND_USAGE_BATCH_SIZE rows are waiting, or by a daemon timer
+        COMMAND_USAGE_FLUSH_SECONDS after the first row was queued. Call
+        close() on shutdown to write anything still queued.
+        
         Args:
             stats: CommandUsageStats to record
             
         Returns:
-            True if successful, False otherwise
+            True if the row was queued or flushed successfully, False if a
+            flush failed. A queued row is not yet stored, so True does not
+            guarantee it will reach the database.
         """
+        with self._usage_lock:
+            self._usage_buffer.append(stats.to_dict())
+            flush_due = len(self._usage_buffer) >= self.COMMAND_USAGE_BATCH_SIZE
+            if not flush_due and self._usage_timer is None:
+                self._usage_timer = threading.Timer(self.COMMAND_USAGE_FLUSH_SECONDS, self.flush_command_usage)
+                self._usage_timer.daemon = True
+                self._usage_timer.start()
+        
+        if flush_due:
+            return self.flush_command_usage()
+        return True
+    
+    def flush_command_usage(self) -> bool:
+        """Insert all queued command usage rows with a single request.
+        
+        Returns:
+            True if successful or nothing was queued, False otherwise
+        """
+        with self._usage_lock:
+            rows, self._usage_buffer = self._usage_buffer, []
+            timer, self._usage_timer = self._usage_timer, None
+        
+        if timer is not None and timer is not threading.current_thread():
+            timer.cancel()
+        
+        if not rows:
+            return True
+        
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/command_usage_stats",
-                headers=self.headers,
-                json=stats.to_dict(),
+                headers={**self.headers, 'Prefer': 'return=minimal'},
+                json=rows,
                 timeout=10
             )
             
-            return response.status_code in [200, 201]
+            if response.status_code in [200, 201, 204]:
+                return True
+            
+            logger.error(f"Failed to record {len(rows)} command usage rows: {response.status_code}")
+            return False
             
         except Exception as e:
             logger.error(f"Error recording command usage: {e}")
             return False
     
+    def close(self) -> bool:
+        """Write any queued command usage rows and stop the flush timer.
+        
+        Returns:
+            True if the final flush succeeded or nothing was queued
+        """
+        return self.flush_command_usage()
+    
     def get_user_statistics(self) -> Dict[str, Any]:
         """Get comprehensive user statistics.
         
@@ -480,7 +541,7 @@ class UserRepository:
         """
         try:
             # Get total users
-            users_response = requests.get(
+            users_response = self.session.get(
                 f"{self.base_url}/user_profiles?select=user_id,is_active,registration_date",
                 headers=self.headers,
                 timeout=10
@@ -552,10 +613,13 @@ class UserRepository:
         Returns:
             Dictionary with command usage statistics
         """
+        # Include rows still waiting in the buffer
+        self.flush_command_usage()
+        
         try:
             cutoff_date = (datetime.utcnow() - timedelta(days=days)).isoformat()
             
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/command_usage_stats?execution_time=gte.{cutoff_date}",
                 headers=self.headers,
                 timeout=10
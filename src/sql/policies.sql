@@ -0,0 +1,14 @@
+-- Row Level Security for the Telegram English Bot tables.
+-- The bot talks to PostgREST with the anon key, so it needs full access to its own tables.
+-- Tighten these policies (or switch the bot to the service role key) for production.
+
+ALTER TABLE lessons ENABLE ROW LEVEL SECURITY;
+ALTER TABLE posting_history ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Bot access to lessons" ON lessons;
+CREATE POLICY "Bot access to lessons" ON lessons
+    FOR ALL USING (true) WITH CHECK (true);
+
+DROP POLICY IF EXISTS "Bot access to posting_history" ON posting_history;
+CREATE POLICY "Bot access to posting_history" ON posting_history
+    FOR ALL USING (true) WITH CHECK (true);
@@ -0,0 +1,55 @@
+-- Supabase (PostgreSQL) schema for the Telegram English Bot.
+-- Paste into the Supabase SQL Editor and run once per project.
+
+CREATE TABLE IF NOT EXISTS lessons (
+    id BIGSERIAL PRIMARY KEY,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    category TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    tags JSONB DEFAULT '[]'::jsonb,
+    source TEXT,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    last_used TIMESTAMPTZ,
+    usage_count INTEGER DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS posting_history (
+    id BIGSERIAL PRIMARY KEY,
+    lesson_id BIGINT REFERENCES lessons(id) ON DELETE CASCADE,
+    message_id BIGINT NOT NULL,
+    channel_id TEXT,
+    posted_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_lessons_category ON lessons(category);
+CREATE INDEX IF NOT EXISTS idx_lessons_last_used ON lessons(last_used);
+CREATE INDEX IF NOT EXISTS idx_lessons_usage_count ON lessons(usage_count);
+CREATE INDEX IF NOT EXISTS idx_posting_history_lesson_id ON posting_history(lesson_id);
+CREATE INDEX IF NOT EXISTS idx_posting_history_posted_at ON posting_history(posted_at);
+
+-- Full-text search over title and content, queried with PostgREST's wfts operator
+ALTER TABLE lessons ADD COLUMN IF NOT EXISTS search_tsv TSVECTOR
+    GENERATED ALWAYS AS (to_tsvector('english', coalesce(title, '') || ' ' || coalesce(content, ''))) STORED;
+CREATE INDEX IF NOT EXISTS idx_lessons_search_tsv ON lessons USING GIN (search_tsv);
+
+-- Atomic usage bump for a posted lesson, called as POST /rest/v1/rpc/increment_lesson_usage
+CREATE OR REPLACE FUNCTION increment_lesson_usage(p_id BIGINT)
+RETURNS VOID
+LANGUAGE sql
+AS $$
+    UPDATE lessons
+    SET usage_count = COALESCE(usage_count, 0) + 1, last_used = NOW()
+    WHERE id = p_id;
+$$;
+
+-- Grouped lesson counts for the statistics endpoint, called as POST /rest/v1/rpc/get_lesson_stats
+CREATE OR REPLACE FUNCTION get_lesson_stats()
+RETURNS TABLE (dimension TEXT, key TEXT, lesson_count BIGINT)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT 'category', category, COUNT(*) FROM lessons GROUP BY category
+    UNION ALL
+    SELECT 'difficulty', difficulty, COUNT(*) FROM lessons GROUP BY difficulty;
+$$;
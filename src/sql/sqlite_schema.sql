@@ -0,0 +1,59 @@
+-- SQLite schema for the Telegram English Bot.
+-- Run by DatabaseManager.initialize_database() with one executescript() call.
+
+-- WAL journaling is stored in the database file; the other settings apply to
+-- the connection that runs this script. journal_mode cannot change inside a
+-- transaction, so the pragmas come before BEGIN.
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS lessons (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    category TEXT NOT NULL CHECK (category IN ('grammar', 'vocabulary', 'common_mistakes')),
+    difficulty TEXT NOT NULL CHECK (difficulty IN ('beginner', 'intermediate', 'advanced')),
+    created_at TEXT NOT NULL,
+    last_used TEXT,
+    usage_count INTEGER DEFAULT 0,
+    tags TEXT,  -- JSON array as string
+    source TEXT DEFAULT 'manual' CHECK (source IN ('manual', 'imported', 'ai_generated')),
+    UNIQUE(title, content)  -- Prevent exact duplicates
+);
+
+CREATE TABLE IF NOT EXISTS posting_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    lesson_id INTEGER NOT NULL,
+    posted_at TEXT NOT NULL,
+    success INTEGER NOT NULL CHECK (success IN (0, 1)),
+    error_message TEXT,
+    retry_count INTEGER DEFAULT 0,
+    FOREIGN KEY (lesson_id) REFERENCES lessons (id)
+);
+
+CREATE TABLE IF NOT EXISTS bot_config (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    bot_token TEXT NOT NULL,
+    channel_id TEXT NOT NULL,
+    posting_time TEXT DEFAULT '09:00',
+    timezone TEXT DEFAULT 'UTC',
+    retry_attempts INTEGER DEFAULT 3,
+    retry_delay INTEGER DEFAULT 60,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+-- Indexes for better performance
+CREATE INDEX IF NOT EXISTS idx_lessons_category ON lessons(category);
+CREATE INDEX IF NOT EXISTS idx_lessons_last_used ON lessons(last_used);
+CREATE INDEX IF NOT EXISTS idx_lessons_usage_count ON lessons(usage_count);
+CREATE INDEX IF NOT EXISTS idx_posting_history_lesson_id ON posting_history(lesson_id);
+CREATE INDEX IF NOT EXISTS idx_posting_history_posted_at ON posting_history(posted_at);
+-- Partial index so the last successful post is read from the first index entry
+CREATE INDEX IF NOT EXISTS idx_posting_history_success_posted_at
+    ON posting_history(posted_at DESC) WHERE success = 1;
+
+COMMIT;
@@ -0,0 +1,26 @@
+"""Datetime helpers shared by the model from_dict methods."""
+
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+# Epoch values above this are taken to be milliseconds rather than seconds
+_EPOCH_MS_THRESHOLD = 1e12
+
+
+def parse_datetime(value: Any) -> Optional[datetime]:
+    """Convert a stored timestamp value to a datetime.
+
+    Accepts None or an empty string (returns None), a datetime (returned as is),
+    an epoch number in seconds or milliseconds (read as naive UTC), or an ISO
+    8601 string, including one with a trailing 'Z'.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, (int, float)):
+        seconds = value / 1000 if value > _EPOCH_MS_THRESHOLD else value
+        return datetime.fromtimestamp(seconds, timezone.utc).replace(tzinfo=None)
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
@@ -0,0 +1,43 @@
+"""JSON helpers that use orjson when it is installed and fall back to the stdlib."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+if orjson is not None:
+    def loads(data: Any) -> Any:
+        """Parse JSON from str, bytes or bytearray."""
+        return orjson.loads(data)
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize an object to UTF-8 encoded JSON bytes."""
+        return orjson.dumps(obj)
+
+    def dumps(obj: Any) -> str:
+        """Serialize an object to a JSON string."""
+        return orjson.dumps(obj).decode()
+
+    def dumps_model(obj: Any) -> bytes:
+        """Serialize a dataclass model to JSON bytes; datetimes become ISO 8601 strings."""
+        return orjson.dumps(obj)
+else:
+    def loads(data: Any) -> Any:
+        """Parse JSON from str, bytes or bytearray."""
+        return json.loads(data)
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize an object to UTF-8 encoded JSON bytes."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def dumps(obj: Any) -> str:
+        """Serialize an object to a JSON string."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+    def dumps_model(obj: Any) -> bytes:
+        """Serialize a dataclass model to JSON bytes; datetimes become ISO 8601 strings."""
+        return dumps_bytes(obj.to_dict())
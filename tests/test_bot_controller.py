@@ -8,11 +8,25 @@ import re
 
 from hypothesis import given, strategies as st, settings
 
+import src.config as config_module
+from src.config import Config
 from src.services.bot_controller import BotController, create_bot_controller
 from src.models.lesson import Lesson
 from telegram.error import TelegramError, RetryAfter, TimedOut, BadRequest, Forbidden
 
 
+@pytest.fixture(autouse=True)
+def global_config(monkeypatch):
+    """Publish a valid Config so services that call get_config() skip the environment.
+    
+    Config validates on construction and is built from the environment by
+    Config.from_env(), so tests construct one explicitly with the required fields.
+    """
+    test_config = Config(bot_token="123456789:ABCdefGHIjklMNOpqrsTUVwxyz", channel_id="@test_channel")
+    monkeypatch.setattr(config_module, "_config", test_config)
+    return test_config
+
+
 class TestBotController:
     """Test cases for BotController class."""
     
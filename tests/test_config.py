@@ -0,0 +1,41 @@
+"""Tests for configuration parsing."""
+
+import pytest
+
+from src.config import Config, parse_admin_user_ids
+
+
+class TestParseAdminUserIds:
+    """Test cases for ADMIN_USER_IDS parsing."""
+
+    def test_parses_comma_separated_ids(self):
+        """IDs are parsed with surrounding whitespace and blank entries ignored."""
+        assert parse_admin_user_ids(" 123, 456 ,789,") == frozenset({123, 456, 789})
+
+    def test_empty_value_has_no_admins(self):
+        """An unset or empty value gives no admin IDs."""
+        assert parse_admin_user_ids("") == frozenset()
+        assert parse_admin_user_ids(None) == frozenset()
+
+    @pytest.mark.parametrize("value", ["123,abc", "123;456", "12 34", "1.5", "@admin"])
+    def test_malformed_entry_raises(self, value):
+        """Any entry that is not a whole integer is rejected instead of skipped."""
+        with pytest.raises(ValueError, match="ADMIN_USER_IDS"):
+            parse_admin_user_ids(value)
+
+    def test_from_env_rejects_malformed_admin_ids(self, monkeypatch):
+        """Config.from_env surfaces a malformed ADMIN_USER_IDS."""
+        monkeypatch.setenv("BOT_TOKEN", "123456789:ABCdefGHIjklMNOpqrsTUVwxyz")
+        monkeypatch.setenv("CHANNEL_ID", "@test_channel")
+        monkeypatch.setenv("ADMIN_USER_IDS", "123,4x56")
+
+        with pytest.raises(ValueError, match="4x56"):
+            Config.from_env()
+
+    def test_from_env_reads_admin_ids(self, monkeypatch):
+        """Config.from_env stores the parsed admin IDs."""
+        monkeypatch.setenv("BOT_TOKEN", "123456789:ABCdefGHIjklMNOpqrsTUVwxyz")
+        monkeypatch.setenv("CHANNEL_ID", "@test_channel")
+        monkeypatch.setenv("ADMIN_USER_IDS", "123, 456")
+
+        assert Config.from_env().admin_user_ids == frozenset({123, 456})
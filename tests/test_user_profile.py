@@ -0,0 +1,64 @@
+"""Tests for the user profile models."""
+
+from unittest.mock import Mock
+
+from src.models.user_profile import QuizAttempt
+from src.services.user_repository import UserRepository
+
+
+class TestQuizAttempt:
+    """Test cases for QuizAttempt scoring."""
+
+    def test_finalize_scores_added_answers(self):
+        """finalize() sets total_questions and score from the answers."""
+        attempt = QuizAttempt(user_id=1, quiz_id=2, lesson_id=3)
+        attempt.add_answer(1, "a", "a", True)
+        attempt.add_answer(2, "b", "c", False)
+        attempt.add_answer(3, "d", "d", True)
+        attempt.add_answer(4, "e", "e", True)
+
+        attempt.finalize()
+
+        assert attempt.total_questions == 4
+        assert attempt.correct_answers == 3
+        assert attempt.score == 75.0
+
+    def test_to_dict_does_not_modify_attempt(self):
+        """to_dict() serializes the attempt without finalizing it."""
+        attempt = QuizAttempt(user_id=1, quiz_id=2, lesson_id=3)
+        attempt.add_answer(1, "a", "a", True)
+
+        data = attempt.to_dict()
+
+        assert data['score'] == 0.0
+        assert data['total_questions'] == 0
+        assert attempt.score == 0.0
+        assert attempt.total_questions == 0
+
+    def test_finalize_keeps_explicit_score(self):
+        """Attempts built with a score and no add_answer calls keep their values."""
+        attempt = QuizAttempt(user_id=1, quiz_id=2, lesson_id=3, score=80.0,
+                              total_questions=5, correct_answers=4)
+
+        attempt.finalize()
+
+        assert attempt.score == 80.0
+        assert attempt.total_questions == 5
+
+    def test_record_quiz_attempt_stores_final_score(self):
+        """Recording an attempt finalizes it before it is serialized."""
+        supabase_manager = Mock()
+        supabase_manager.base_url = "https://example.supabase.co/rest/v1"
+        supabase_manager.headers = {}
+        supabase_manager.session.post.return_value = Mock(status_code=201)
+        repo = UserRepository(supabase_manager)
+
+        attempt = QuizAttempt(user_id=1, quiz_id=2, lesson_id=3)
+        attempt.add_answer(1, "a", "a", True)
+        attempt.add_answer(2, "b", "c", False)
+
+        assert repo.record_quiz_attempt(attempt)
+
+        stored = supabase_manager.session.post.call_args.kwargs['json']
+        assert stored['total_questions'] == 2
+        assert stored['score'] == 50.0